@@ -50,6 +50,7 @@ from .inventory import (
     save_inventory,
     load_inventory,
     load_or_make_inventory,
+    load_or_make_inventory_many,
     item_match,
 )
 from .ip import (
@@ -60,8 +61,16 @@ from .ip import (
     ips_points,
     ipv_grid,
     ipv_points,
+    set_releasegil,
+)
+from .message import (
+    open_grib,
+    read_msg,
+    read_msgs,
+    decode_msg,
+    decode_msgs,
+    write_msg,
 )
-from .message import read_msg, decode_msg, write_msg
 from .template import Template, make_template
 from .wgrib2 import (
     MemoryBuffer,
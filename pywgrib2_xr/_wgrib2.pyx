@@ -34,13 +34,13 @@ cdef extern from 'pywgrib2.h':
                   int *igdtleni, int *gdtnumo, int *gdtmplo, int *gdtleno,
                   int *mi, int *mo, int *km, int *ibi, unsigned char *li,
                   double *gi, int *no, double *rlat, double *rlon, int *ibo,
-                  unsigned char *lo, double *go, int *iret)
+                  unsigned char *lo, double *go, int *iret) nogil
     void IPOLATEV(int *ip, int *ipopt, int *gdtnumi, int *gdtmpli,
                   int *igdtleni, int *gdtnumo, int *gdtmplo, int *gdtleno,
                   int *mi, int *mo, int *km, int *ibi, unsigned char *li,
                   double *ui, double *vi, int *no, double *rlat, double *rlon,
                   double *crot, double *srot, int *ibo, unsigned char *lo,
-                  double *uo, double *vo, int *iret)
+                  double *uo, double *vo, int *iret) nogil
 
 
 # def set_num_threads(int n):
@@ -80,7 +80,7 @@ def get_mem_buf(int n):
     if bufsize < 1:
         return b''
     cdef unsigned char *cbuf = \
-            <unsigned char*> PyMem_Malloc(bufsize * sizeof(unsigned char*))
+            <unsigned char*> PyMem_Malloc(bufsize * sizeof(unsigned char))
     if not cbuf:
         raise MemoryError()
     cdef bytes py_string
@@ -91,6 +91,17 @@ def get_mem_buf(int n):
     return None if rc else py_string
 
 
+def get_mem_buf_array(int n):
+    # Copies buffer content directly to numpy array, no intermediate bytes
+    cdef size_t bufsize = wgrib2_get_mem_buffer_size(n)
+    cdef np.ndarray[np.uint8_t, ndim=1, mode='c'] arr = np.empty((bufsize,),
+                                                                 dtype=np.uint8)
+    if bufsize < 1:
+        return arr
+    rc = wgrib2_get_mem_buffer(&arr[0], bufsize, n)
+    return None if rc else arr
+
+
 def set_mem_buf(int n, const unsigned char[:] data):
     rc = wgrib2_set_mem_buffer(&data[0], data.size, n)
     return None if rc else 0
@@ -125,6 +136,20 @@ def gdswiz(int gdtnum, np.ndarray[int] gdtmpl, int opt,
     return nret
 
 
+cdef bint _releasegil = True
+
+
+def set_releasegil(bint flag):
+    """Sets whether the GIL is released during iplib calls.
+
+    Returns previous setting.
+    """
+    global _releasegil
+    cdef bint old = _releasegil
+    _releasegil = flag
+    return old
+
+
 def ipolates(int ip, np.ndarray[int] ipopt,
              int gdtnum_in, np.ndarray[int] gdstmpl_in,
              int gdtnum_out, np.ndarray[int] gdstmpl_out,
@@ -136,12 +161,30 @@ def ipolates(int ip, np.ndarray[int] ipopt,
     cdef int iret, n_out
     cdef int gdtlen_in = gdstmpl_in.size
     cdef int gdtlen_out = gdstmpl_out.size
+    cdef int *ipopt_p = &ipopt[0]
+    cdef int *gdt_in_p = &gdstmpl_in[0]
+    cdef int *gdt_out_p = &gdstmpl_out[0]
+    cdef int *ib_in_p = &ib_in[0]
+    cdef int *ib_out_p = &ib_out[0]
+    cdef unsigned char *l_in_p = &l_in[0]
+    cdef unsigned char *l_out_p = &l_out[0]
+    cdef double *g_in_p = &g_in[0]
+    cdef double *g_out_p = &g_out[0]
+    cdef double *rlat_p = &rlat[0]
+    cdef double *rlon_p = &rlon[0]
     if gdtnum_out < 0:
         n_out = m_out
-    IPOLATES(&ip, &ipopt[0], &gdtnum_in, &gdstmpl_in[0], &gdtlen_in,
-             &gdtnum_out, &gdstmpl_out[0], &gdtlen_out, &m_in, &m_out, &km,
-             &ib_in[0], &l_in[0], &g_in[0], &n_out, &rlat[0], &rlon[0],
-             &ib_out[0], &l_out[0], &g_out[0], &iret)
+    if _releasegil:
+        with nogil:
+            IPOLATES(&ip, ipopt_p, &gdtnum_in, gdt_in_p, &gdtlen_in,
+                     &gdtnum_out, gdt_out_p, &gdtlen_out, &m_in, &m_out, &km,
+                     ib_in_p, l_in_p, g_in_p, &n_out, rlat_p, rlon_p,
+                     ib_out_p, l_out_p, g_out_p, &iret)
+    else:
+        IPOLATES(&ip, ipopt_p, &gdtnum_in, gdt_in_p, &gdtlen_in,
+                 &gdtnum_out, gdt_out_p, &gdtlen_out, &m_in, &m_out, &km,
+                 ib_in_p, l_in_p, g_in_p, &n_out, rlat_p, rlon_p,
+                 ib_out_p, l_out_p, g_out_p, &iret)
     return iret, n_out
 
 
@@ -179,11 +222,34 @@ def ipolatev(int ip, np.ndarray[int] ipopt,
                &ylon[0], &ylat[0], &area[0])
         if iret < 0:
             return 2, 0     # Unrecognised projection
-    IPOLATEV(&ip, &ipopt[0], &gdtnum_in, &gdstmpl_in[0], &gdtlen_in,
-             &gdtnum_out, &gdstmpl_out[0], &gdtlen_out, &m_in, &m_out, &km,
-             &ib_in[0], &l_in[0], &u_in[0], &v_in[0], &n_out,
-             &rlat[0], &rlon[0], &crot[0], &srot[0], &ib_out[0], &l_out[0],
-             &u_out[0], &v_out[0], &iret)
+    cdef int *ipopt_p = &ipopt[0]
+    cdef int *gdt_in_p = &gdstmpl_in[0]
+    cdef int *gdt_out_p = &gdstmpl_out[0]
+    cdef int *ib_in_p = &ib_in[0]
+    cdef int *ib_out_p = &ib_out[0]
+    cdef unsigned char *l_in_p = &l_in[0]
+    cdef unsigned char *l_out_p = &l_out[0]
+    cdef double *u_in_p = &u_in[0]
+    cdef double *v_in_p = &v_in[0]
+    cdef double *u_out_p = &u_out[0]
+    cdef double *v_out_p = &v_out[0]
+    cdef double *rlat_p = &rlat[0]
+    cdef double *rlon_p = &rlon[0]
+    cdef double *crot_p = &crot[0]
+    cdef double *srot_p = &srot[0]
+    if _releasegil:
+        with nogil:
+            IPOLATEV(&ip, ipopt_p, &gdtnum_in, gdt_in_p, &gdtlen_in,
+                     &gdtnum_out, gdt_out_p, &gdtlen_out, &m_in, &m_out, &km,
+                     ib_in_p, l_in_p, u_in_p, v_in_p, &n_out,
+                     rlat_p, rlon_p, crot_p, srot_p, ib_out_p, l_out_p,
+                     u_out_p, v_out_p, &iret)
+    else:
+        IPOLATEV(&ip, ipopt_p, &gdtnum_in, gdt_in_p, &gdtlen_in,
+                 &gdtnum_out, gdt_out_p, &gdtlen_out, &m_in, &m_out, &km,
+                 ib_in_p, l_in_p, u_in_p, v_in_p, &n_out,
+                 rlat_p, rlon_p, crot_p, srot_p, ib_out_p, l_out_p,
+                 u_out_p, v_out_p, &iret)
     return iret, n_out
 
 
@@ -5,18 +5,18 @@ try:
 except ImportError:
     ArrayLike = Any
 import dask.array as da
+import numpy as np
 import xarray as xr
 from xarray.core.pycompat import dask_array_type
 
 from .ip import (
-    grid2earth_grid,
+    _grid_rotation,
     ips_points,
     ipv_points,
     ips_grid,
     ipv_grid,
 )
 from .grids import (
-    #    Grid,
     #    Point,
     GridLatLon,
     GridRotLatLon,
@@ -25,6 +25,7 @@ from .grids import (
     GridLambertConformal,
     GridGaussian,
     GridSpaceView,
+    _grid_fromgds,
     grid_fromgds,
 )
 
@@ -42,8 +43,10 @@ WIND = {
     "U-GWD": "V-GWD",
     "USSD": "VSSD",
 }
+# v -> u mappings
+WIND_INVERSE = {v: u for u, v in WIND.items()}
 
-GEO_COORDS = set(
+GEO_COORDS = frozenset(
     [
         "x",
         "y",
@@ -61,10 +64,23 @@ GEO_COORDS = set(
 )
 
 
+def rotate_winds(
+    crot: np.ndarray, srot: np.ndarray, u: np.ndarray, v: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    # Allocates only the results and one scratch array
+    urot = np.multiply(crot, u)
+    tmp = np.multiply(srot, v)
+    urot += tmp
+    vrot = np.multiply(crot, v)
+    np.multiply(srot, u, out=tmp)
+    vrot -= tmp
+    return urot, vrot
+
+
 def get_v_component(uname: str, name: str) -> Union[str, None]:
     vname = WIND.get(uname)
     if not vname:
-        return None if uname in WIND.values() else name
+        return None if uname in WIND_INVERSE else name
     return name.replace(uname, vname)
 
 
@@ -74,13 +90,13 @@ def ip2pts_scalar(var: xr.DataArray, npoints: int, **kwargs: Any) -> ArrayLike:
         return u2["data"]
 
     if isinstance(var.data, dask_array_type):
+        # Not vectorized: iplib interpolates all fields of a chunk in one call
         ip = da.gufunc(
             _ip,
             signature="(m,n)->(p)",
             axes=[(-2, -1), (-1)],
             output_dtypes=(var.dtype,),
             output_sizes={"p": npoints},
-            vectorize=True,
         )
     else:
         ip = _ip
@@ -96,13 +112,13 @@ def ip2pts_vector(
         return d["udata"], d["vdata"]
 
     if isinstance(u_var.data, dask_array_type):
+        # Not vectorized: iplib interpolates all fields of a chunk in one call
         ip = da.gufunc(
             _ip,
             signature="(m,n),(m,n)->(p),(p)",
             axes=[(-2, -1), (-2, -1), (-1,), (-1,)],
             output_dtypes=(u_var.dtype, v_var.dtype),
             output_sizes={"p": npoints},
-            vectorize=True,
         )
     else:
         ip = _ip
@@ -117,13 +133,13 @@ def ip2grid_scalar(var: xr.DataArray, **kwargs: Any) -> ArrayLike:
 
     if isinstance(var.data, dask_array_type):
         i, j = kwargs["grid_out"].gdtmpl[7:9]
+        # Not vectorized: iplib interpolates all fields of a chunk in one call
         ip = da.gufunc(
             _ip,
             signature="(m,n)->(j,i)",
             axes=[(-2, -1), (-2, -1)],
             output_dtypes=(var.dtype,),
             output_sizes={"i": i, "j": j},
-            vectorize=True,
         )
     else:
         ip = _ip
@@ -140,13 +156,13 @@ def ip2grid_vector(
 
     if isinstance(u_var.data, dask_array_type):
         i, j = kwargs["grid_out"].gdtmpl[7:9]
+        # Not vectorized: iplib interpolates all fields of a chunk in one call
         ip = da.gufunc(
             _ip,
             signature="(m,n),(m,n)->(j,i),(j,i)",
             axes=[(-2, -1), (-2, -1), (-2, -1), (-2, -1)],
             output_dtypes=(u_var.dtype, v_var.dtype),
             output_sizes={"i": i, "j": j},
-            vectorize=True,
         )
     else:
         ip = _ip
@@ -170,10 +186,16 @@ class Wgrib2DatasetAccessor:
 
     # @property
     def get_grid(self):
-        """Returns GRIB2 grid definition as dictionary."""
+        """Returns GRIB2 grid definition."""
+        proj = self._obj.attrs["Projection"]
+        attrs = self._obj.coords[proj].attrs
+        return grid_fromgds(attrs["GRIB_gdtnum"], list(attrs["GRIB_gdtmpl"]))
+
+    def _shared_grid(self):
+        # Cached instance, shared with templates. Must not be modified.
         proj = self._obj.attrs["Projection"]
         attrs = self._obj.coords[proj].attrs
-        return grid_fromgds(attrs["GRIB_gdtnum"], attrs["GRIB_gdtmpl"])
+        return _grid_fromgds(attrs["GRIB_gdtnum"], tuple(attrs["GRIB_gdtmpl"]))
 
     def location(self, points, iptype="neighbour"):
         """Remaps all variables to point locations.
@@ -199,11 +221,11 @@ class Wgrib2DatasetAccessor:
         coords = {cfname: ((), 0, points.attrs)}
         coords.update(points.coords)
         # Copy remaining coords
-        for name in set(self._obj.coords.keys()) - GEO_COORDS:
+        for name in self._obj.coords.keys() - GEO_COORDS:
             var = self._obj.coords[name]
             coords[name] = (var.dims, var.data, var.attrs)
 
-        grid = self.get_grid()
+        grid = self._shared_grid()
         data_vars = {}
         for name, var in self._obj.data_vars.items():
             dims = var.dims[:-2] + points.dims
@@ -235,7 +257,7 @@ class Wgrib2DatasetAccessor:
         attrs["Projection"] = cfname
         return xr.Dataset(data_vars, coords, attrs)
 
-    def grid(self, grid, iptype="neighbour"):
+    def grid(self, grid, iptype="neighbour", copy=True):
         """Remaps all variables to points specified by `longitude` and `latitude`.
 
         Parameters
@@ -249,6 +271,9 @@ class Wgrib2DatasetAccessor:
             Dictionary allows interpolation type specific to variable.
 
             Example: ``iptype = {'APCP': 'budget', 'default': 'bilinear'}``.
+        copy : bool
+            When `grid` is the dataset grid, return a copy of the dataset
+            if True (default), otherwise return the dataset itself.
 
         Returns
         -------
@@ -257,15 +282,15 @@ class Wgrib2DatasetAccessor:
         """
         if isinstance(iptype, dict) and "default" not in iptype:
             iptype["default"] = "neighbour"
-        src_grid = self.get_grid()
+        src_grid = self._shared_grid()
         if grid == src_grid:
-            return self._obj.copy()
+            return self._obj.copy() if copy else self._obj
         cfname = grid.cfname
         # Set geographic coordinates
         coords = {cfname: ((), 0, grid.attrs)}
         coords.update(grid.coords)
         # Copy remaining coords
-        for name in set(self._obj.coords.keys()) - GEO_COORDS:
+        for name in self._obj.coords.keys() - GEO_COORDS:
             var = self._obj.coords[name]
             coords[name] = (var.dims, var.data, var.attrs)
 
@@ -311,14 +336,15 @@ class Wgrib2DatasetAccessor:
             New dataset with vectors in new coordinates.
         """
         ds = self._obj if inplace else self._obj.copy()
-        grid = self.get_grid()
+        grid = self._shared_grid()
         if grid.params["GRIB_winds"] == winds:
             # Nothing to do
             return ds
 
-        ret = grid2earth_grid(grid)
-        crot = ret["crot"]
-        srot = ret["srot"]
+        # Same grid is typical for a sequence of datasets
+        crot64, srot64 = _grid_rotation(grid)
+        # iplib returns float64, rotate in data precision: dtype -> (crot, srot)
+        rotations = {}
         for name, var in self._obj.data_vars.items():
             shortname = var.attrs.get("short_name")
             if not shortname:
@@ -327,11 +353,18 @@ class Wgrib2DatasetAccessor:
             if not v_name or v_name == name:
                 continue
             v_var = self._obj[v_name]
-            urot = crot * var.values + srot * v_var.values
-            vrot = -srot * var.values + crot * v_var.values
+            dtype = np.result_type(var.dtype, v_var.dtype)
+            if dtype not in rotations:
+                rotations[dtype] = (
+                    crot64.astype(dtype, copy=False),
+                    srot64.astype(dtype, copy=False),
+                )
+            crot, srot = rotations[dtype]
+            urot, vrot = rotate_winds(crot, srot, var.values, v_var.values)
             ds[name] = (var.dims, urot.astype(var.dtype, copy=False), var.attrs)
             ds[v_name] = (v_var.dims, vrot.astype(v_var.dtype, copy=False), v_var.attrs)
-        # Update gdtmpl
+        # Update gdtmpl. Cached grid is shared, modify a new instance.
+        grid = grid_fromgds(grid.gdtnum, grid.gdtmpl)
         grid.set_winds(winds)
         proj = self._obj.attrs["Projection"]
         ds.coords[proj].attrs = grid.params
@@ -8,11 +8,13 @@ from typing import (
     Dict,
     List,
     NamedTuple,
+    Optional,
     Sequence,
     Tuple,
     Union,
     cast,
 )
+from weakref import WeakKeyDictionary
 
 try:
     from numpy.typing import ArrayLike
@@ -39,6 +41,27 @@ FileIndices = DefaultDict[str, FileIndex]  # variable name -> FileIndex
 
 WGRIB2_LOCK = SerializableLock()
 
+# Template -> (projection variable, dataset attributes), shared by all datasets
+# opened with the same template. xarray copies attributes, sharing is safe.
+_TEMPLATE_CACHE: "WeakKeyDictionary[Template, Tuple[_Variable, Dict[str, Any]]]"
+_TEMPLATE_CACHE = WeakKeyDictionary()
+
+
+class FileArrays(NamedTuple):
+    header_indices: np.ndarray  # (nmsgs, ndim) array
+    offsets: np.ndarray  # object array of message offsets
+    inventory: bytes  # all offsets, input for wgrib2 -i_file
+
+
+def make_file_arrays(index: Dict[HeaderIndices, str], ndim: int) -> FileArrays:
+    header_indices = np.array(list(index.keys()), dtype=np.intp)
+    offsets = list(index.values())
+    return FileArrays(
+        header_indices.reshape((len(index), ndim)),
+        np.array(offsets, dtype=object),
+        "\n".join(offsets).encode(),
+    )
+
 
 class Dataset(NamedTuple):
     dims: Dict[str, int]
@@ -46,18 +69,39 @@ class Dataset(NamedTuple):
     attrs: Dict[str, Any]
 
 
-# FIXME: might use https://github.com/roebel/py_find_1st
-def find_1st(array, value):
-    return np.nonzero(array == value)[0][0]
-
-
 def build_file_index(
     items: Sequence[MetaData],
     template: Template,
 ) -> FileIndices:
     file_indices: FileIndices = defaultdict(cast(Callable, partial(defaultdict, dict)))
+    # coordinate name -> {coordinate value: index}
+    coord_indices: Dict[str, Dict[Any, int]] = {}
+
+    def _find(coord: str, value: Any) -> Optional[int]:
+        try:
+            indices = coord_indices[coord]
+        except KeyError:
+            indices = {}
+            for i, v in enumerate(template.coords[coord].data.tolist()):
+                indices.setdefault(v, i)
+            coord_indices[coord] = indices
+        return indices.get(value)
+
+    # Variable names depend only on few MetaData fields, see item_to_varname
+    varnames: Dict[Tuple[Any, ...], str] = {}
+
     for item in (i for i in items if template.item_match(i)):
-        varname = template.item_to_varname(item)
+        key = (
+            item.varname,
+            item.bot_level_code,
+            item.level_str,
+            item.time_str,
+            item.end_ft - item.start_ft,
+        )
+        try:
+            varname = varnames[key]
+        except KeyError:
+            varname = varnames[key] = template.item_to_varname(item)
         try:
             specs = template.var_specs[varname]
         except KeyError:
@@ -69,11 +113,11 @@ def build_file_index(
         header_indices: Tuple[int, ...] = ()
         found = True
         if time_coord in specs.dims:
-            try:
-                i = find_1st(template.coords[time_coord].data, fcst_time)
-                header_indices = (i,)
-            except IndexError:
+            i = _find(time_coord, fcst_time)
+            if i is None:
                 found = False
+            else:
+                header_indices = (i,)
         else:
             if template.coords[time_coord].data != fcst_time:
                 found = False
@@ -84,28 +128,30 @@ def build_file_index(
             )
             continue
         if level_coord in specs.dims:
-            try:
-                i = find_1st(template.coords[level_coord].data, item.level_value)
-                header_indices += (i,)
-            except IndexError:
+            i = _find(level_coord, item.level_value)
+            if i is None:
                 logger.info(
                     "Variable {:s} level {!r} not found in template, "
                     "skipping".format(varname, item.level_value)
                 )
                 continue
+            header_indices += (i,)
         file_indices[varname][item.file][header_indices] = item.offset
     return file_indices
 
 
-def expand_item(item: Sequence[Any], shape: Tuple[int, ...]) -> Tuple[List[Any], ...]:
-    expanded_item = []
+def expand_item(
+    item: Sequence[Any], shape: Tuple[int, ...]
+) -> Tuple[Sequence[int], ...]:
+    expanded_item: List[Sequence[int]] = []
     for i, size in zip(item, shape):
         if isinstance(i, list):
             expanded_item.append(i)
         elif isinstance(i, np.ndarray):
             expanded_item.append(i.tolist())
         elif isinstance(i, slice):
-            expanded_item.append(list(range(i.start or 0, i.stop or size, i.step or 1)))
+            # Not materialised, range supports len()
+            expanded_item.append(range(*i.indices(size)))
         elif isinstance(i, int):
             expanded_item.append([i])
         else:
@@ -113,6 +159,23 @@ def expand_item(item: Sequence[Any], shape: Tuple[int, ...]) -> Tuple[List[Any],
     return tuple(expanded_item)
 
 
+def item_positions(
+    expanded_item: Tuple[Sequence[int], ...], shape: Tuple[int, ...]
+) -> List[np.ndarray]:
+    """Returns lookup tables: header index -> array field position.
+
+    Same as list.index(), -1 means header index not selected.
+    """
+    luts = []
+    for it, size in zip(expanded_item, shape):
+        lut = np.full((size,), -1, dtype=np.intp)
+        # return_index gives first occurrence
+        indices, first = np.unique(np.asarray(it, dtype=np.intp), return_index=True)
+        lut[indices] = first
+        luts.append(lut)
+    return luts
+
+
 class OnDiskArray:
     def __init__(
         self,
@@ -125,9 +188,14 @@ class OnDiskArray:
         self.file_index = file_index
         self.shape = tuple(shape)
         self.geo_ndim = len(template.grid.dims)
-        self.npts = np.prod(shape[-self.geo_ndim :])
+        self.npts = int(np.prod(self.shape[-self.geo_ndim :]))
         self.missing_value = UNDEFINED  # wgrib2 missing value
         self.dtype = DTYPE
+        header_ndim = len(self.shape) - self.geo_ndim
+        self._file_arrays = {
+            file: make_file_arrays(index, header_ndim)
+            for file, index in file_index.items()
+        }
 
     def __getitem__(self, item: Tuple[Any, ...]) -> ArrayLike:
         assert isinstance(item, tuple), "Item type must be tuple not {!r}".format(
@@ -138,60 +206,22 @@ class OnDiskArray:
         )
 
         header_item = expand_item(item[: -self.geo_ndim], self.shape)
-        array_field_shape = (
-            tuple(len(i) for i in header_item) + self.shape[-self.geo_ndim :]
-        )
+        # Allocate only the requested part of the grid. Shape is obtained by
+        # indexing zero-strided array.
+        geo_item = (Ellipsis,) + item[-self.geo_ndim :]
+        geo_shape = np.broadcast_to(DTYPE.type(0), self.shape[-self.geo_ndim :])[
+            geo_item
+        ].shape
+        array_field_shape = tuple(len(i) for i in header_item) + geo_shape
         array_field = np.full(array_field_shape, fill_value=np.nan, dtype=DTYPE)
-        datasize = self.npts * array_field.dtype.itemsize
-        for file, index in self.file_index.items():
-            # Faster, longer code
-            def _get_array_indexes():
-                for header_indices, offset in index.items():
-                    try:
-                        afi = [
-                            it.index(ix) for it, ix in zip(header_item, header_indices)
-                        ]
-                        yield afi, offset
-                    except ValueError:
-                        continue
-
-            try:
-                seq_of_array_field_indexes, offsets = zip(*_get_array_indexes())
-            except ValueError:
+        luts = item_positions(header_item, self.shape)
+        for file in self.file_index:
+            ret = self._read_file(file, luts, geo_item)
+            if ret is None:
                 continue
-            inventory = MemoryBuffer()
-            inventory.set("\n".join(offsets))
-            output = MemoryBuffer()
-            args = [
-                file,
-                "-rewind_init",
-                file,
-                "-i_file",
-                inventory,
-                "-rewind_init",
-                inventory,
-                "-inv",
-                "/dev/null",
-                "-no_header",
-                "-bin",
-                output,
-            ]
-            try:
-                wgrib(*args)
-                values = output.get("b")
-            except WgribError as e:
-                logger.error("wgrib2 error: {:s}".format(str(e)))
-                output.close()
-                continue
-            finally:
-                inventory.close()
-                output.close()
-                free_files(file)
-            for pos, array_field_indexes in zip(
-                range(0, len(values), datasize), seq_of_array_field_indexes
-            ):
-                chunk = np.frombuffer(values[pos : pos + datasize], dtype=DTYPE)
-                array_field.__getitem__(tuple(array_field_indexes)).flat[:] = chunk
+            array_field_indexes, chunks = ret
+            # One scatter into array_field
+            array_field[tuple(array_field_indexes.T)] = chunks
 
         # Slow, shorter code
         # for header_indices, offset in index.items():
@@ -227,12 +257,68 @@ class OnDiskArray:
         #        output.close()
         #        free_files(path)
 
-        array = array_field[(Ellipsis,) + item[-self.geo_ndim :]]
-        array[array == self.missing_value] = np.nan
-        for i, it in reversed(list(enumerate(item[: -self.geo_ndim]))):
-            if isinstance(it, int):
-                array = array[(slice(None, None, None),) * i + (0,)]
-        return array
+        # Integer indices were expanded to length 1 axes, drop them
+        int_axes = tuple(
+            i for i, it in enumerate(item[: -self.geo_ndim]) if isinstance(it, int)
+        )
+        return np.squeeze(array_field, axis=int_axes)
+
+    def _read_file(
+        self, file: str, luts: List[np.ndarray], geo_item: Tuple[Any, ...]
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Reads messages from `file` selected by lookup tables `luts`.
+
+        Returns array field indexes and data as (nmsgs, ny, nx) array indexed
+        by `geo_item`, or None if there is nothing to read.
+        """
+        header_indices, offsets, inventory_data = self._file_arrays[file]
+        array_field_indexes = np.empty_like(header_indices)
+        for axis, lut in enumerate(luts):
+            array_field_indexes[:, axis] = lut[header_indices[:, axis]]
+        selected = np.all(array_field_indexes >= 0, axis=1)
+        if not selected.any():
+            return None
+        if not selected.all():
+            array_field_indexes = array_field_indexes[selected]
+            inventory_data = "\n".join(offsets[selected]).encode()
+        # wgrib2 keeps global state (open files, memory buffers), reads from
+        # different threads must not overlap.
+        with WGRIB2_LOCK:
+            inventory = MemoryBuffer()
+            inventory.set(inventory_data)
+            output = MemoryBuffer()
+            args = [
+                file,
+                "-rewind_init",
+                file,
+                "-i_file",
+                inventory,
+                "-rewind_init",
+                inventory,
+                "-inv",
+                "/dev/null",
+                "-no_header",
+                "-bin",
+                output,
+            ]
+            try:
+                wgrib(*args)
+                values = output.get("a")
+            except WgribError as e:
+                logger.error("wgrib2 error: {:s}".format(str(e)))
+                return None
+            finally:
+                inventory.close()
+                output.close()
+                free_files(file)
+        nmsgs = values.size // self.npts
+        chunks = values[: nmsgs * self.npts].reshape(
+            (nmsgs,) + self.shape[-self.geo_ndim :]
+        )[geo_item]
+        # Only decoded values can be missing, the rest of array field is NaN.
+        # values is a private writable array, replace in place.
+        chunks[chunks == self.missing_value] = np.nan
+        return array_field_indexes[:nmsgs], chunks
 
 
 def open_dataset(
@@ -257,10 +343,14 @@ def open_dataset(
         np.array(items[0].reftime),
         {"standard_name": "reference_time"},
     )
-    # Projection variable
-    variables[template.grid.cfname] = _Variable((), np.array(0), template.grid.attrs)
-    attrs = template.attrs.copy()
-    attrs["coordinates"] = " ".join(
-        tuple(template.coords.keys()) + ("reftime", template.grid.cfname)
-    )
+    try:
+        projection, attrs = _TEMPLATE_CACHE[template]
+    except KeyError:
+        projection = _Variable((), np.array(0), template.grid.attrs)
+        attrs = template.attrs.copy()
+        attrs["coordinates"] = " ".join(
+            tuple(template.coords.keys()) + ("reftime", template.grid.cfname)
+        )
+        _TEMPLATE_CACHE[template] = (projection, attrs)
+    variables[template.grid.cfname] = projection
     return Dataset(dimensions, variables, attrs)
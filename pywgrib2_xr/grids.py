@@ -2,6 +2,8 @@
 
 from abc import ABC, abstractmethod
 import enum
+from functools import lru_cache
+import math
 import struct
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
@@ -37,12 +39,55 @@ class GDTNum(enum.IntEnum):
     "Space View"
 
 
+# Shapes of the Earth with fixed parameters (Code Table 3.2)
+_GLOBES: Dict[int, Dict[str, Any]] = {
+    0: {"shape": "sphere", "earth_radius": 6367470.0},
+    2: {
+        "shape": "ellipsoid",
+        "semi_major_axis": 6378160.0,
+        "semi_minor_axis": 6356775.0,
+    },
+    4: {
+        "shape": "GRS80",
+        "semi_major_axis": 6378137.0,
+        "semi_minor_axis": 6356752.140,
+    },
+    5: {
+        "shape": "WGS84",
+        "semi_major_axis": 6378137.0,
+        "semi_minor_axis": 6356752.245,
+    },
+    6: {"shape": "sphere", "earth_radius": 6371229.0},
+    8: {"shape": "sphere", "earth_radius": 6371200.0},
+    9: {
+        "shape": "Airy",
+        "semi_major_axis": 6377563.396,
+        "semi_minor_axis": 6356256.909,
+    },
+}
+
+# CF attributes of coordinate variables, shared by all grids, must not be modified.
+# Not MappingProxyType, grids must remain picklable.
+_LON_ATTRS = {
+    "long_name": "longitude coordinate",
+    "units": "degree_east",
+    "standard_name": "longitude",
+}
+_LAT_ATTRS = {
+    "long_name": "latitude coordinate",
+    "units": "degree_north",
+    "standard_name": "latitude",
+}
+_LON_AXIS_ATTRS = {**_LON_ATTRS, "axis": "X"}
+_LAT_AXIS_ATTRS = {**_LAT_ATTRS, "axis": "Y"}
+_X_ATTRS = {"units": "m", "standard_name": "projection_x_coordinate", "axis": "X"}
+_Y_ATTRS = {"units": "m", "standard_name": "projection_y_coordinate", "axis": "Y"}
+
+
 def _norm_lon(a: float) -> float:
-    while a > 360:
-        a -= 360
-    while a < 0:
-        a += 360
-    return a
+    r = a % 360
+    # Positive multiples of 360 map to 360, as before
+    return 360 if r == 0 and a > 0 else r
 
 
 class Point:
@@ -56,29 +101,21 @@ class Point:
         latitude: Sequence[float],
         coord: Optional[Tuple[str, Sequence[Any], Dict[str, Any]]] = None,
     ):
-        npts = len(longitude)
-        assert len(latitude) == npts
+        longitude = np.ascontiguousarray(longitude, dtype=np.float64)
+        latitude = np.ascontiguousarray(latitude, dtype=np.float64)
+        if longitude.ndim != 1 or longitude.shape != latitude.shape:
+            raise ValueError("longitude and latitude must be 1-D of the same length")
+        npts = longitude.shape[0]
         if coord is None:
-            coord = ("point", np.array(range(npts)), {"long_name": "point number"})
+            coord = ("point", np.arange(npts), {"long_name": "point number"})
         else:
             coord = (coord[0], np.asarray(coord[1]), coord[2])
-        assert len(coord[1]) == npts
-        longitude = np.ascontiguousarray(longitude, dtype=np.float64)
-        lon_attrs = {
-            "long_name": "longitude coordinate",
-            "units": "degree_east",
-            "standard_name": "longitude",
-        }
-        latitude = np.ascontiguousarray(latitude, dtype=np.float64)
-        lat_attrs = {
-            "long_name": "latitude coordinate",
-            "units": "degree_north",
-            "standard_name": "latitude",
-        }
+            if coord[1].shape != (npts,):
+                raise ValueError("coord values must match number of points")
         self._dims = (coord[0],)
         self._coords = {
-            "longitude": _Variable(self._dims, longitude, lon_attrs),
-            "latitude": _Variable(self._dims, latitude, lat_attrs),
+            "longitude": _Variable(self._dims, longitude, _LON_ATTRS),
+            "latitude": _Variable(self._dims, latitude, _LAT_ATTRS),
             coord[0]: _Variable(self._dims, coord[1], coord[2]),
         }
 
@@ -123,21 +160,30 @@ class Grid(ABC):
     :py:func:`grid_fromgdt`, :py:func:`grid_fromstring` and :py:func:`grid_fromdict`.
     """
 
+    __slots__: Tuple[str, ...] = ("gdtmpl", "_key", "_params", "_globe", "_coords")
+
     cfname = ""
     "Class name"
     gdtnum = GDTNum.UNDEFINED
     "Grid definition template number"
     _sec3_head_fmt = ">IBBIBBHBBIBIBI"
     _sec3_param_fmt = ""  # specific to projection
-    _sec3_len = 0
+    _sec3_struct = struct.Struct(_sec3_head_fmt)
     _respos = 0
     _scanpos = 0
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._sec3_struct = struct.Struct(cls._sec3_head_fmt + cls._sec3_param_fmt)
+
     def __init__(self, gdtmpl: List[int]) -> None:
-        npts = gdtmpl[7] * gdtmpl[8]
-        sec3 = self._mksec3(gdtmpl)
-        longitude, latitude = latlon(sec3, npts)
         self.gdtmpl = gdtmpl.copy()
+        self._key = (int(self.gdtnum), tuple(gdtmpl))
+        # Grid point coordinates are only needed here to convert scanning mode,
+        # otherwise they are computed on first access to coords.
+        longitude = latitude = None
+        if self._wesn_needs_latlon(gdtmpl[self._scanpos]):
+            longitude, latitude = self._latlon()
         wesn_gdtmpl = self.to_wesn(longitude, latitude)
         self._params: Dict[str, Any] = {
             "GRIB_gdtnum": self.gdtnum,
@@ -145,44 +191,48 @@ class Grid(ABC):
         }
         self.decode_params()
         self.decode_globe()
-        self.set_coords(longitude, latitude)
+        if longitude is not None:
+            self._set_coords(longitude, latitude)
+
+    def _latlon(self) -> Tuple[np.ndarray, np.ndarray]:
+        npts = self.gdtmpl[7] * self.gdtmpl[8]
+        return latlon(self._mksec3(self.gdtmpl), npts)
+
+    def _wesn_needs_latlon(self, scan: int) -> bool:
+        # Whether to_wesn() needs grid point coordinates for this scanning mode
+        return scan != 0x40
 
     def _mksec3(self, gdtmpl: List[int]) -> bytes:
-        fmt = self._sec3_head_fmt + self._sec3_param_fmt
-        seclen = self._sec3_len
         npts = gdtmpl[7] * gdtmpl[8]
-        gds = np.concatenate([[3, 0, npts, 0, 0, self.gdtnum], gdtmpl])
-        ugds = np.empty(gds.shape, dtype=np.uint32)
-        for i, v in enumerate(gds):
-            assert abs(v) <= 0x7FFFFFFF
-            # -1 might be missing value
-            ugds[i] = v if v > -1 else 0x80000000 - v
-        return struct.pack(fmt, seclen, *ugds)
+        gds = np.array([3, 0, npts, 0, 0, self.gdtnum, *gdtmpl], dtype=np.int64)
+        assert np.abs(gds).max() <= 0x7FFFFFFF
+        # -1 might be missing value
+        ugds = np.where(gds > -1, gds, 0x80000000 - gds).astype(np.uint32)
+        # Section length is the packed size
+        return self._sec3_struct.pack(self._sec3_struct.size, *ugds.tolist())
 
     def __repr__(self) -> str:
         return repr({**self.crs, **self.globe, **self.params, **self.coords})
 
     def __eq__(self, other: object) -> bool:
-        if isinstance(other, self.__class__):
-            return (
-                self.__class__.gdtnum == other.__class__.gdtnum
-                and self.gdtmpl == other.gdtmpl
-            )
+        if other is self:
+            return True
+        if other.__class__ is self.__class__:
+            return self._key == other._key  # type: ignore
         return False
 
+    def __hash__(self) -> int:
+        # gdtmpl is not modified after __init__
+        return hash(self._key)
+
     def decode_globe(self):
         code, sradius, vradius, smajor, vmajor, sminor, vminor = self.gdtmpl[:7]
-        if code == 0:
-            self._globe = {"shape": "sphere", "earth_radius": 6367470.0}
+        globe = _GLOBES.get(code)
+        if globe is not None:
+            self._globe = globe.copy()
         elif code == 1:
             radius = vradius / 10 ** sradius
             self._globe = {"shape": "sphere", "earth_radius": radius}
-        elif code == 2:
-            self._globe = {
-                "shape": "ellipsoid",
-                "semi_major_axis": 6378160.0,
-                "semi_minor_axis": 6356775.0,
-            }
         elif code in (3, 7):
             i = 3 if code == 3 else 0  # return value in [m]
             major = vmajor / 10 ** (smajor - i)
@@ -192,28 +242,6 @@ class Grid(ABC):
                 "semi_major_axis": major,
                 "semi_minor_axis": minor,
             }
-        elif code == 4:
-            self._globe = {
-                "shape": "GRS80",
-                "semi_major_axis": 6378137.0,
-                "semi_minor_axis": 6356752.140,
-            }
-        elif code == 5:
-            self._globe = {
-                "shape": "WGS84",
-                "semi_major_axis": 6378137.0,
-                "semi_minor_axis": 6356752.245,
-            }
-        elif code == 6:
-            self._globe = {"shape": "sphere", "earth_radius": 6371229.0}
-        elif code == 8:
-            self._globe = {"shape": "sphere", "earth_radius": 6371200.0}
-        elif code == 9:
-            self._globe = {
-                "shape": "Airy",
-                "semi_major_axis": 6377563.396,
-                "semi_minor_axis": 6356256.909,
-            }
         self._globe["code"] = code
 
     @staticmethod
@@ -222,11 +250,11 @@ class Grid(ABC):
         vradius = vmajor = vminor = -1  # 0xFFFFFFFF
         if code == 1:
             scale = 1
-            vradius = int(kwargs["earth_radius"] * 10 ** scale)
+            vradius = int(round(kwargs["earth_radius"] * 10 ** scale))
         elif code in (3, 7):
             scale = 4 if code == 3 else 1
-            vmajor = int(kwargs["semi_major_axis"] * 10 ** scale)
-            vminor = int(kwargs["semi_minor_axis"] * 10 ** scale)
+            vmajor = int(round(kwargs["semi_major_axis"] * 10 ** scale))
+            vminor = int(round(kwargs["semi_minor_axis"] * 10 ** scale))
         return [code, scale, vradius, scale, vmajor, scale, vminor]
 
     @abstractmethod
@@ -251,13 +279,24 @@ class Grid(ABC):
     def set_coords(self, longitude: ArrayLike, latitude: ArrayLike) -> None:
         self._coords: Dict[str, Any] = {}
 
+    def _set_coords(self, longitude: ArrayLike, latitude: ArrayLike) -> None:
+        self.set_coords(longitude, latitude)
+        # Grids are cached and their coordinates shared between datasets
+        for v in self._coords.values():
+            v.data.flags.writeable = False
+
     @property
     def attrs(self) -> Dict[str, Any]:
         return {**self.crs, **self.globe, **self.params}
 
     @property
     def coords(self) -> Dict[str, _Variable]:
-        return self._coords
+        """Grid coordinates, computed on first access."""
+        try:
+            return self._coords
+        except AttributeError:
+            self._set_coords(*self._latlon())
+            return self._coords
 
     @property
     @abstractmethod
@@ -336,10 +375,11 @@ class Grid(ABC):
 class GridLatLon(Grid):
     """Grid definition for latitude-longitude (also known as Plate Carree) projection."""
 
+    __slots__ = ()
+
     cfname = "latitude_longitude"
     gdtnum = GDTNum.LATLON
     _sec3_param_fmt = "IIIIIIBIIIIB"
-    _sec3_len = 72
     _respos = 19
     _scanpos = 18
 
@@ -366,17 +406,17 @@ class GridLatLon(Grid):
     def encode_params(winds: Optional[str], **params) -> Sequence[int]:
         ba = params.get("basic_angle", 0)
         sba = params.get("subdiv_basic_angle", -1)  # 0xFFFFFFFF)
-        scale = 1e-6 if params.get("basic_angle", 0) == 0 else ba / sba
-        La1 = int(params["La1"] / scale)
-        Lo1 = int(params["Lo1"] / scale)
+        scale = 1e-6 if ba == 0 else ba / sba
+        La1 = int(round(params["La1"] / scale))
+        Lo1 = int(round(params["Lo1"] / scale))
         # Override coordinates of the last point, if present, for consistency
         # FIXME: make it conditional, key on La2 or Dj, only one need to be present.
         params["La2"] = params["La1"] + (params["Nj"] - 1) * params["Dj"]
         params["Lo2"] = (params["Lo1"] + (params["Ni"] - 1) * params["Di"]) % 360
-        La2 = int(params["La2"] / scale)
-        Lo2 = int(params["Lo2"] / scale)
-        Di = int(params["Di"] / scale)
-        Dj = int(params["Dj"] / scale)
+        La2 = int(round(params["La2"] / scale))
+        Lo2 = int(round(params["Lo2"] / scale))
+        Di = int(round(params["Di"] / scale))
+        Dj = int(round(params["Dj"] / scale))
         Ni = params["Ni"]
         Nj = params["Nj"]
         res = 0x38 if winds == "grid" else 0x30
@@ -397,35 +437,34 @@ class GridLatLon(Grid):
         return params
 
     def set_coords(self, longitude: Any, latitude: Any) -> None:
-        lon = longitude.reshape(self.shape)[0, :]
-        lon_attrs = {
-            "long_name": "longitude coordinate",
-            "units": "degree_east",
-            "standard_name": "longitude",
-            "axis": "X",
-        }
-        lat = latitude.reshape(self.shape)[:, 0]
-        lat_attrs = {
-            "long_name": "latitude coordinate",
-            "units": "degree_north",
-            "standard_name": "latitude",
-            "axis": "Y",
-        }
+        lon = longitude[: self.shape[1]].copy()
+        lat = latitude[:: self.shape[1]].copy()
         self._coords = {
-            "longitude": _Variable(("longitude",), lon, lon_attrs),
-            "latitude": _Variable(("latitude",), lat, lat_attrs),
+            "longitude": _Variable(("longitude",), lon, _LON_AXIS_ATTRS),
+            "latitude": _Variable(("latitude",), lat, _LAT_AXIS_ATTRS),
         }
 
+    def _wesn_needs_latlon(self, scan: int) -> bool:
+        # Reversed i or j directions only swap the corners in the template
+        return scan & 0x30 != 0
+
     def to_wesn(self, longitude: Any, latitude: Any) -> List[int]:
         gdtmpl = self.gdtmpl[:]
-        if gdtmpl[self._scanpos] != 0x40:
+        scan = gdtmpl[self._scanpos]
+        if scan != 0x40:
             gdtmpl[self._scanpos] = 0x40
+            if longitude is None:
+                if scan & 0x80:
+                    gdtmpl[12], gdtmpl[15] = gdtmpl[15], gdtmpl[12]
+                if not scan & 0x40:
+                    gdtmpl[11], gdtmpl[14] = gdtmpl[14], gdtmpl[11]
+                return gdtmpl
             ba, sba = gdtmpl[9:11]
             scale = 1e-6 if ba == 0 else ba / sba
-            gdtmpl[11] = int(latitude[0] / scale)
-            gdtmpl[12] = int(longitude[0] / scale)
-            gdtmpl[14] = int(latitude[-1] / scale)
-            gdtmpl[15] = int(longitude[-1] / scale)
+            gdtmpl[11] = int(round(latitude[0] / scale))
+            gdtmpl[12] = int(round(longitude[0] / scale))
+            gdtmpl[14] = int(round(latitude[-1] / scale))
+            gdtmpl[15] = int(round(longitude[-1] / scale))
         return gdtmpl
 
     @property
@@ -440,10 +479,11 @@ class GridLatLon(Grid):
 class GridRotLatLon(Grid):
     """Grid definition for rotated latitude-longitude projection."""
 
+    __slots__ = ()
+
     cfname = "rotated_latitude_longitude"
     gdtnum = GDTNum.ROT_LATLON
     _sec3_param_fmt = "IIIIIIBIIIIBIII"
-    _sec3_len = 84
     _respos = 13
     _scanpos = 18
 
@@ -489,23 +529,23 @@ class GridRotLatLon(Grid):
     def encode_params(winds: Optional[str], **params) -> Sequence[int]:
         ba = params.get("basic_angle", 0)
         sba = params.get("subdiv_basic_angle", -1)  # 0xFFFFFFFF
-        scale = 1e-6 if params.get("basic_angle", 0) == 0 else ba / sba
-        La1 = int(params["La1"] / scale)
-        Lo1 = int(params["Lo1"] / scale)
+        scale = 1e-6 if ba == 0 else ba / sba
+        La1 = int(round(params["La1"] / scale))
+        Lo1 = int(round(params["Lo1"] / scale))
         # Override coordinates of the last point, if present, for consistency
         params["La2"] = params["La1"] + (params["Nj"] - 1) * params["Dj"]
         params["Lo2"] = (params["Lo1"] + (params["Ni"] - 1) * params["Di"]) % 360
-        La2 = int(params["La2"] / scale)
-        Lo2 = int(params["Lo2"] / scale)
-        Di = int(params["Di"] / scale)
-        Dj = int(params["Dj"] / scale)
+        La2 = int(round(params["La2"] / scale))
+        Lo2 = int(round(params["Lo2"] / scale))
+        Di = int(round(params["Di"] / scale))
+        Dj = int(round(params["Dj"] / scale))
         Ni = params["Ni"]
         Nj = params["Nj"]
         res = 0x38 if winds == "grid" else 0x30
         scan = 0x40
-        LaSP = int(params["LaSP"] / scale)
-        LoSP = int(params["LoSP"] / scale)
-        Rot = int(params["Rot"] / scale)
+        LaSP = int(round(params["LaSP"] / scale))
+        LoSP = int(round(params["LoSP"] / scale))
+        Rot = int(round(params["Rot"] / scale))
         return [
             Ni,
             Nj,
@@ -564,22 +604,12 @@ class GridRotLatLon(Grid):
             "axis": "X",
         }
         lon = longitude.reshape(self.shape)
-        lon_attrs = {
-            "long_name": "longitude coordinate",
-            "units": "degree_east",
-            "standard_name": "longitude",
-        }
         lat = latitude.reshape(self.shape)
-        lat_attrs = {
-            "long_name": "latitude coordinate",
-            "units": "degree_north",
-            "standard_name": "latitude",
-        }
         self._coords = {
             "x": _Variable(("x",), x, x_attrs),
             "y": _Variable(("y",), y, y_attrs),
-            "longitude": _Variable(self.dims, lon, lon_attrs),
-            "latitude": _Variable(self.dims, lat, lat_attrs),
+            "longitude": _Variable(self.dims, lon, _LON_ATTRS),
+            "latitude": _Variable(self.dims, lat, _LAT_ATTRS),
         }
 
     def to_wesn(self, longitude: Any, latitude: Any) -> List[int]:
@@ -588,10 +618,10 @@ class GridRotLatLon(Grid):
             gdtmpl[self._scanpos] = 0x40
             ba, sba = gdtmpl[9:11]
             scale = 1e-6 if ba == 0 else ba / sba
-            gdtmpl[11] = int(latitude[0] / scale)
-            gdtmpl[12] = int(longitude[0] / scale)
-            gdtmpl[14] = int(latitude[-1] / scale)
-            gdtmpl[15] = int(longitude[-1] / scale)
+            gdtmpl[11] = int(round(latitude[0] / scale))
+            gdtmpl[12] = int(round(longitude[0] / scale))
+            gdtmpl[14] = int(round(latitude[-1] / scale))
+            gdtmpl[15] = int(round(longitude[-1] / scale))
         return gdtmpl
 
     @property
@@ -611,10 +641,11 @@ class GridRotLatLon(Grid):
 class GridMercator(Grid):
     """Grid definition for Mercator projection."""
 
+    __slots__ = ()
+
     cfname = "mercator"
     gdtnum = GDTNum.MERCATOR
     _sec3_param_fmt = "IIIIBIIIBIII"
-    _sec3_len = 72
     _respos = 11
     _scanpos = 15
 
@@ -640,13 +671,13 @@ class GridMercator(Grid):
 
     @staticmethod
     def encode_params(winds: Optional[str], **params) -> Sequence[int]:
-        La1 = int(params["La1"] * 1e6)
-        Lo1 = int(params["Lo1"] * 1e6)
-        La2 = int(params["La2"] * 1e6)
-        Lo2 = int(params["Lo2"] * 1e6)
-        LaD = int(params["LaD"] * 1e6)
-        Di = int(params["Di"] * 1e3)
-        Dj = int(params["Dj"] * 1e3)
+        La1 = int(round(params["La1"] * 1e6))
+        Lo1 = int(round(params["Lo1"] * 1e6))
+        La2 = int(round(params["La2"] * 1e6))
+        Lo2 = int(round(params["Lo2"] * 1e6))
+        LaD = int(round(params["LaD"] * 1e6))
+        Di = int(round(params["Di"] * 1e3))
+        Dj = int(round(params["Dj"] * 1e3))
         Ni = params["Ni"]
         Nj = params["Nj"]
         res = 0x38 if winds == "grid" else 0x30
@@ -672,21 +703,11 @@ class GridMercator(Grid):
 
     def set_coords(self, longitude: Any, latitude: Any) -> None:
         # FIXME: add x/y coordinates
-        lon = longitude.reshape(self.shape)[0, :]
-        lon_attrs = {
-            "long_name": "longitude coordinate",
-            "units": "degree_east",
-            "standard_name": "longitude",
-        }
-        lat = latitude.reshape(self.shape)[:, 0]
-        lat_attrs = {
-            "long_name": "latitude coordinate",
-            "units": "degree_north",
-            "standard_name": "latitude",
-        }
+        lon = longitude[: self.shape[1]].copy()
+        lat = latitude[:: self.shape[1]].copy()
         self._coords = {
-            "longitude": _Variable(("longitude",), lon, lon_attrs),
-            "latitude": _Variable(("latitude",), lat, lat_attrs),
+            "longitude": _Variable(("longitude",), lon, _LON_ATTRS),
+            "latitude": _Variable(("latitude",), lat, _LAT_ATTRS),
         }
 
     def to_wesn(self, longitude: Any, latitude: Any) -> List[int]:
@@ -694,10 +715,10 @@ class GridMercator(Grid):
         if gdtmpl[self._scanpos] != 0x40:
             gdtmpl[self._scanpos] = 0x40
             scale = 1e-6
-            gdtmpl[9] = int(latitude[0] / scale)
-            gdtmpl[10] = int(longitude[0] / scale)
-            gdtmpl[13] = int(latitude[-1] / scale)
-            gdtmpl[14] = int(longitude[-1] / scale)
+            gdtmpl[9] = int(round(latitude[0] / scale))
+            gdtmpl[10] = int(round(longitude[0] / scale))
+            gdtmpl[13] = int(round(latitude[-1] / scale))
+            gdtmpl[14] = int(round(longitude[-1] / scale))
         return gdtmpl
 
     @property
@@ -715,10 +736,11 @@ class GridMercator(Grid):
 class GridPolarStereo(Grid):
     """Grid definition for Polar Stereographic (North and South) projection."""
 
+    __slots__ = ()
+
     cfname = "polar_stereographic"
     gdtnum = GDTNum.POLAR_STEREO
     _sec3_param_fmt = "IIIIBIIIIBB"
-    _sec3_len = 65
     _respos = 11
     _scanpos = 17
 
@@ -743,12 +765,12 @@ class GridPolarStereo(Grid):
 
     @staticmethod
     def encode_params(winds: Optional[str], **params) -> Sequence[int]:
-        La1 = int(params["La1"] * 1e6)
-        Lo1 = int(params["Lo1"] * 1e6)
-        LaD = int(params["LaD"] * 1e6)
-        LoV = int(params["LoV"] * 1e6)
-        Dx = int(params["Dx"] * 1e3)
-        Dy = int(params["Dy"] * 1e3)
+        La1 = int(round(params["La1"] * 1e6))
+        Lo1 = int(round(params["Lo1"] * 1e6))
+        LaD = int(round(params["LaD"] * 1e6))
+        LoV = int(round(params["LoV"] * 1e6))
+        Dx = int(round(params["Dx"] * 1e3))
+        Dy = int(round(params["Dy"] * 1e3))
         Nx = params["Nx"]
         Ny = params["Ny"]
         res = 0x38 if winds == "grid" else 0x30
@@ -780,35 +802,19 @@ class GridPolarStereo(Grid):
         xo, yo = latlon2xy(self._mksec3(gdtmpl), longitude, latitude, lon_o, lat_o)
         dx = self.params["GRIB_Dx"]
         dy = self.params["GRIB_Dy"]
-        x = (np.arange(self.params["GRIB_Nx"]) - xo) * dx
-        x_attrs = {
-            "units": "m",
-            "standard_name": "projection_x_coordinate",
-            "axis": "X",
-        }
-        y = (np.arange(self.params["GRIB_Ny"]) - yo) * dy
-        y_attrs = {
-            "units": "m",
-            "standard_name": "projection_y_coordinate",
-            "axis": "Y",
-        }
+        x = np.arange(self.params["GRIB_Nx"], dtype=np.float64)
+        x -= xo
+        x *= dx
+        y = np.arange(self.params["GRIB_Ny"], dtype=np.float64)
+        y -= yo
+        y *= dy
         lon = longitude.reshape(self.shape)
-        lon_attrs = {
-            "long_name": "longitude coordinate",
-            "units": "degree_east",
-            "standard_name": "longitude",
-        }
         lat = latitude.reshape(self.shape)
-        lat_attrs = {
-            "long_name": "latitude coordinate",
-            "units": "degree_north",
-            "standard_name": "latitude",
-        }
         self._coords = {
-            "longitude": _Variable(self.dims, lon, lon_attrs),
-            "latitude": _Variable(self.dims, lat, lat_attrs),
-            "x": _Variable(("x",), x, x_attrs),
-            "y": _Variable(("y",), y, y_attrs),
+            "longitude": _Variable(self.dims, lon, _LON_ATTRS),
+            "latitude": _Variable(self.dims, lat, _LAT_ATTRS),
+            "x": _Variable(("x",), x, _X_ATTRS),
+            "y": _Variable(("y",), y, _Y_ATTRS),
         }
 
     def to_wesn(self, longitude: Any, latitude: Any) -> List[int]:
@@ -816,8 +822,8 @@ class GridPolarStereo(Grid):
         if gdtmpl[self._scanpos] != 0x40:
             gdtmpl[self._scanpos] = 0x40
             scale = 1e-6
-            gdtmpl[9] = int(latitude[0] / scale)
-            gdtmpl[10] = int(longitude[0] / scale)
+            gdtmpl[9] = int(round(latitude[0] / scale))
+            gdtmpl[10] = int(round(longitude[0] / scale))
         return gdtmpl
 
     @property
@@ -837,10 +843,11 @@ class GridPolarStereo(Grid):
 class GridLambertConformal(Grid):
     """Grid definition for Lambert conformal projection."""
 
+    __slots__ = ("_lat_origin",)
+
     cfname = "lambert_conformal_conic"
     gdtnum = GDTNum.LAMBERT_CONFORMAL
     _sec3_param_fmt = "IIIIBIIIIBBIIII"
-    _sec3_len = 81
     _respos = 11
     _scanpos = 17
 
@@ -881,21 +888,25 @@ class GridLambertConformal(Grid):
                 "GRIB_LoSP": LoSP * 1e-6,
             }
         )
+        # Latitude of projection origin
+        self._lat_origin = (
+            self._params["GRIB_Latin1"] + self._params["GRIB_Latin2"]
+        ) / 2
 
     @staticmethod
     def encode_params(winds: Optional[str], **params) -> Sequence[int]:
-        La1 = int(params["La1"] * 1e6)
-        Lo1 = int(params["Lo1"] * 1e6)
-        LaD = int(params["LaD"] * 1e6)
-        LoV = int(params["LoV"] * 1e6)
-        Latin1 = int(params["Latin1"] * 1e6)
-        Latin2 = int(params["Latin2"] * 1e6)
+        La1 = int(round(params["La1"] * 1e6))
+        Lo1 = int(round(params["Lo1"] * 1e6))
+        LaD = int(round(params["LaD"] * 1e6))
+        LoV = int(round(params["LoV"] * 1e6))
+        Latin1 = int(round(params["Latin1"] * 1e6))
+        Latin2 = int(round(params["Latin2"] * 1e6))
         proj_centre = 0x80 if params["Latin2"] < 0.0 else 0x00
         la_sp = -90.0 if proj_centre == 0 else 90.0
-        LaSP = int(params.get("LaSP", la_sp) * 1e6)
-        LoSP = int(params.get("LoSP", 0) * 1e6)
-        Dx = int(params["Dx"] * 1e3)
-        Dy = int(params["Dy"] * 1e3)
+        LaSP = int(round(params.get("LaSP", la_sp) * 1e6))
+        LoSP = int(round(params.get("LoSP", 0) * 1e6))
+        Dx = int(round(params["Dx"] * 1e3))
+        Dy = int(round(params["Dy"] * 1e3))
         Nx = params["Nx"]
         Ny = params["Ny"]
         res = 0x38 if winds == "grid" else 0x30
@@ -938,41 +949,25 @@ class GridLambertConformal(Grid):
         return params
 
     def set_coords(self, longitude: Any, latitude: Any) -> None:
-        lat_o = (self._params["GRIB_Latin1"] + self._params["GRIB_Latin2"]) / 2
+        lat_o = self._lat_origin
         lon_o = self._params["GRIB_LoV"]
         gdtmpl = self._params["GRIB_gdtmpl"]
         xo, yo = latlon2xy(self._mksec3(gdtmpl), longitude, latitude, lon_o, lat_o)
         dx = self._params["GRIB_Dx"]
         dy = self._params["GRIB_Dy"]
-        x = (np.arange(self._params["GRIB_Nx"]) - xo) * dx
-        x_attrs = {
-            "units": "m",
-            "standard_name": "projection_x_coordinate",
-            "axis": "X",
-        }
-        y = (np.arange(self._params["GRIB_Ny"]) - yo) * dy
-        y_attrs = {
-            "units": "m",
-            "standard_name": "projection_y_coordinate",
-            "axis": "Y",
-        }
+        x = np.arange(self._params["GRIB_Nx"], dtype=np.float64)
+        x -= xo
+        x *= dx
+        y = np.arange(self._params["GRIB_Ny"], dtype=np.float64)
+        y -= yo
+        y *= dy
         lon = longitude.reshape(self.shape)
-        lon_attrs = {
-            "long_name": "longitude coordinate",
-            "units": "degree_east",
-            "standard_name": "longitude",
-        }
         lat = latitude.reshape(self.shape)
-        lat_attrs = {
-            "long_name": "latitude coordinate",
-            "units": "degree_north",
-            "standard_name": "latitude",
-        }
         self._coords = {
-            "longitude": _Variable(self.dims, lon, lon_attrs),
-            "latitude": _Variable(self.dims, lat, lat_attrs),
-            "x": _Variable(("x",), x, x_attrs),
-            "y": _Variable(("y",), y, y_attrs),
+            "longitude": _Variable(self.dims, lon, _LON_ATTRS),
+            "latitude": _Variable(self.dims, lat, _LAT_ATTRS),
+            "x": _Variable(("x",), x, _X_ATTRS),
+            "y": _Variable(("y",), y, _Y_ATTRS),
         }
 
     def to_wesn(self, longitude: Any, latitude: Any) -> List[int]:
@@ -980,13 +975,12 @@ class GridLambertConformal(Grid):
         if gdtmpl[self._scanpos] != 0x40:
             gdtmpl[self._scanpos] = 0x40
             scale = 1e-6
-            gdtmpl[9] = int(latitude[0] / scale)
-            gdtmpl[10] = int(longitude[0] / scale)
+            gdtmpl[9] = int(round(latitude[0] / scale))
+            gdtmpl[10] = int(round(longitude[0] / scale))
         return gdtmpl
 
     @property
     def crs(self) -> Dict[str, Any]:
-        lat_origin = (self._params["GRIB_Latin1"] + self._params["GRIB_Latin2"]) / 2
         return {
             "grid_mapping_name": self.cfname,
             "longitude_of_central_meridian": self._params["GRIB_LoV"],
@@ -994,7 +988,7 @@ class GridLambertConformal(Grid):
                 self._params["GRIB_LoV"],
                 self._params["GRIB_LoV"],
             ),
-            "latitude_of_projection_origin": lat_origin,
+            "latitude_of_projection_origin": self._lat_origin,
         }
 
     @property
@@ -1005,10 +999,11 @@ class GridLambertConformal(Grid):
 class GridGaussian(Grid):
     """Grid definition for Global Gaussian projection."""
 
+    __slots__ = ()
+
     cfname = "gaussian"
     gdtnum = GDTNum.GAUSSIAN
     _sec3_param_fmt = "IIIIIIBIIIIB"
-    _sec3_len = 72
     _respos = 13
     _scanpos = 18
 
@@ -1035,15 +1030,15 @@ class GridGaussian(Grid):
     def encode_params(winds: Optional[str], **params) -> List[int]:
         ba = params.get("basic_angle", 0)
         sba = params.get("subdiv_basic_angle", -1)  # 0xFFFFFFFF)
-        scale = 1e-6 if params.get("basic_angle", 0) == 0 else ba / sba
+        scale = 1e-6 if ba == 0 else ba / sba
         Ni = params["Ni"]
         Nj = params["Nj"]
-        La1 = int(params["La1"] / scale)
-        Lo1 = int(params["Lo1"] / scale)
-        La2 = int(params.get("La2", -params["La1"]) / scale)
+        La1 = int(round(params["La1"] / scale))
+        Lo1 = int(round(params["Lo1"] / scale))
+        La2 = int(round(params.get("La2", -params["La1"]) / scale))
         lo2 = params["Lo1"] + (Ni - 1) * params["Di"]
-        Lo2 = int(params.get("Lo2", lo2) / scale)
-        Di = int(params["Di"] / scale)
+        Lo2 = int(round(params.get("Lo2", lo2) / scale))
+        Di = int(round(params["Di"] / scale))
         N = params.get("N") or Nj // 2
         res = 0x38 if winds == "grid" else 0x30
         scan = 0x40
@@ -1062,23 +1057,11 @@ class GridGaussian(Grid):
         return params
 
     def set_coords(self, longitude: Any, latitude: Any) -> None:
-        lon = longitude.reshape(self.shape)[0, :]
-        lon_attrs = {
-            "long_name": "longitude coordinate",
-            "units": "degree_east",
-            "standard_name": "longitude",
-            "axis": "X",
-        }
-        lat = latitude.reshape(self.shape)[:, 0]
-        lat_attrs = {
-            "long_name": "latitude coordinate",
-            "units": "degree_north",
-            "standard_name": "latitude",
-            "axis": "Y",
-        }
+        lon = longitude[: self.shape[1]].copy()
+        lat = latitude[:: self.shape[1]].copy()
         self._coords = {
-            "longitude": _Variable(("longitude",), lon, lon_attrs),
-            "latitude": _Variable(("latitude",), lat, lat_attrs),
+            "longitude": _Variable(("longitude",), lon, _LON_AXIS_ATTRS),
+            "latitude": _Variable(("latitude",), lat, _LAT_AXIS_ATTRS),
         }
 
     def to_wesn(self, longitude: Any, latitude: Any) -> List[int]:
@@ -1087,10 +1070,10 @@ class GridGaussian(Grid):
             gdtmpl[self._scanpos] = 0x40
             ba, sba = gdtmpl[9:11]
             scale = 1e-6 if ba == 0 else ba / sba
-            gdtmpl[11] = int(latitude[0] / scale)
-            gdtmpl[12] = int(longitude[0] / scale)
-            gdtmpl[14] = int(latitude[-1] / scale)
-            gdtmpl[15] = int(longitude[-1] / scale)
+            gdtmpl[11] = int(round(latitude[0] / scale))
+            gdtmpl[12] = int(round(longitude[0] / scale))
+            gdtmpl[14] = int(round(latitude[-1] / scale))
+            gdtmpl[15] = int(round(longitude[-1] / scale))
         return gdtmpl
 
     @property
@@ -1105,6 +1088,8 @@ class GridGaussian(Grid):
 class GridSpaceView(Grid):
     """Grid definition for Space View projection."""
 
+    __slots__ = ()
+
     cfname = "space_view"
     gdtnum = GDTNum.SPACE_VIEW
     _sec3_param_fmt = "IIIIBIIIIBIIII"
@@ -1117,12 +1102,12 @@ class GridSpaceView(Grid):
         Ny = params["Ny"]
         Dx = params["Dx"]
         Dy = params["Dy"]
-        Xp = int(params["Xp"] * 1e3)
-        Yp = int(params["Yp"] * 1e3)
-        Nr = int(params["Nr"] * 1e3)
-        Lap = int(params["Lap"] * 1e6)
-        Lop = int(params["Lop"] * 1e6)
-        OriAngle = int(params["OriAngle"] * 1e6)
+        Xp = int(round(params["Xp"] * 1e3))
+        Yp = int(round(params["Yp"] * 1e3))
+        Nr = int(round(params["Nr"] * 1e3))
+        Lap = int(round(params["Lap"] * 1e6))
+        Lop = int(round(params["Lop"] * 1e6))
+        OriAngle = int(round(params["OriAngle"] * 1e6))
         Xo = int(params["Xo"])
         Yo = int(params["Yo"])
         res = 0x38 if winds == "grid" else 0x30
@@ -1176,35 +1161,32 @@ class GridSpaceView(Grid):
             rx = self._globe["semi_major_axis"]
             ry = self._globe["semi_minor_axis"]
         h = self._params["GRIB_Nr"]
-        a_x = np.arctan(rx / (rx + h))
-        a_y = np.arctan(ry / (ry + h))
+        a_x = math.atan(rx / (rx + h))
+        a_y = math.atan(ry / (ry + h))
         dx = self._params["GRIB_Dx"]
         dy = self._params["GRIB_Dy"]
         xp = self._params["GRIB_Xp"]
         yp = self._params["GRIB_Yp"]
-        x = 2 * a_x * h / dx * (np.arange(self._params["GRIB_Nx"] - xp))
+        x = np.arange(self._params["GRIB_Nx"], dtype=np.float64)
+        x -= xp
+        x *= 2 * a_x * h / dx
         x_attrs = {"units": "m", "standard_name": "projection_x_coordinate"}
-        y = 2 * a_y * h / dy * (np.arange(self._params["GRIB_Ny"] - yp))
+        y = np.arange(self._params["GRIB_Ny"], dtype=np.float64)
+        y -= yp
+        y *= 2 * a_y * h / dy
         y_attrs = {"units": "m", "standard_name": "projection_y_coordinate"}
         lon = longitude.reshape(self.shape)
-        lon_attrs = {
-            "long_name": "longitude coordinate",
-            "units": "degree_east",
-            "standard_name": "longitude",
-        }
         lat = latitude.reshape(self.shape)
-        lat_attrs = {
-            "long_name": "latitude coordinate",
-            "units": "degree_north",
-            "standard_name": "latitude",
-        }
         self._coords = {
             "x": _Variable(("x",), x, x_attrs),
             "y": _Variable(("y",), y, y_attrs),
-            "longitude": _Variable(self.dims, lon, lon_attrs),
-            "latitude": _Variable(self.dims, lat, lat_attrs),
+            "longitude": _Variable(self.dims, lon, _LON_ATTRS),
+            "latitude": _Variable(self.dims, lat, _LAT_ATTRS),
         }
 
+    def _wesn_needs_latlon(self, scan: int) -> bool:
+        return False
+
     def to_wesn(self, longitude: Any, latitude: Any) -> List[int]:
         gdtmpl = self.gdtmpl[:]
         if gdtmpl[self._scanpos] != 0x40:
@@ -1220,6 +1202,37 @@ class GridSpaceView(Grid):
         return ("y", "x")
 
 
+# Factory lookup tables
+_GDTNUM_GRIDS = {
+    GDTNum.LATLON: GridLatLon,
+    GDTNum.ROT_LATLON: GridRotLatLon,
+    GDTNum.MERCATOR: GridMercator,
+    GDTNum.POLAR_STEREO: GridPolarStereo,
+    GDTNum.LAMBERT_CONFORMAL: GridLambertConformal,
+    GDTNum.GAUSSIAN: GridGaussian,
+    GDTNum.SPACE_VIEW: GridSpaceView,
+}
+_PROJNAME_GRIDS = {
+    "latitude_longitude": GridLatLon,
+    "rotated_latitude_longitude": GridRotLatLon,
+    "mercator": GridMercator,
+    "polar_stereographic": GridPolarStereo,
+    "lambert_conformal": GridLambertConformal,
+    "gaussian": GridGaussian,
+    "space_view": GridSpaceView,
+}
+# wgrib2 -new_grid projection names
+_WGRIB2_GRIDS = {
+    "latlon": GridLatLon,
+    "rot-ll": GridRotLatLon,
+    "mercator": GridMercator,
+    "nps": GridPolarStereo,
+    "sps": GridPolarStereo,
+    "lambert": GridLambertConformal,
+    "gaussian": GridGaussian,
+}
+
+
 def grid_fromgds(gdtnum, gdtmpl):
     """Factory method to create projection from grid definition section.
 
@@ -1235,20 +1248,20 @@ def grid_fromgds(gdtnum, gdtmpl):
     Grid
         Projection specific class instance.
     """
-    cls = {
-        GDTNum.LATLON: GridLatLon,
-        GDTNum.ROT_LATLON: GridRotLatLon,
-        GDTNum.MERCATOR: GridMercator,
-        GDTNum.POLAR_STEREO: GridPolarStereo,
-        GDTNum.LAMBERT_CONFORMAL: GridLambertConformal,
-        GDTNum.GAUSSIAN: GridGaussian,
-        GDTNum.SPACE_VIEW: GridSpaceView,
-    }.get(gdtnum)
+    cls = _GDTNUM_GRIDS.get(gdtnum)
     if not cls:
         raise ValueError("Invalid or unsupported projection: {:d}".format(gdtnum))
     return cls(gdtmpl)
 
 
+@lru_cache(maxsize=32)
+def _grid_fromgds(gdtnum: int, gdtmpl: Tuple[int, ...]) -> Grid:
+    # Returns shared instance, must not be modified.
+    # Grid coordinates are computed once per grid definition.
+    # gdtmpl must be hashable, Grid expects a list
+    return grid_fromgds(gdtnum, list(gdtmpl))
+
+
 def grid_fromdict(projname, globe=None, **kwargs):
     """Factory method to create projection from dictionary.
 
@@ -1357,15 +1370,7 @@ def grid_fromdict(projname, globe=None, **kwargs):
     Grid
         Projection specific class instance.
     """
-    cls = {
-        "latitude_longitude": GridLatLon,
-        "rotated_latitude_longitude": GridRotLatLon,
-        "mercator": GridMercator,
-        "polar_stereographic": GridPolarStereo,
-        "lambert_conformal": GridLambertConformal,
-        "gaussian": GridGaussian,
-        "space_view": GridSpaceView,
-    }.get(projname)
+    cls = _PROJNAME_GRIDS.get(projname)
     if not cls:
         raise ValueError("Invalid or unsupported projection: {:s}".format(projname))
     return cls.fromdict(**kwargs)
@@ -1491,15 +1496,7 @@ def grid_fromstring(string, winds="grid", globe=None):
         tokens = string.split()
 
     projname = tokens[0].split(":")[0]
-    f = {
-        "latlon": GridLatLon.fromstring,
-        "rot-ll": GridRotLatLon.fromstring,
-        "mercator": GridMercator.fromstring,
-        "nps": GridPolarStereo.fromstring,
-        "sps": GridPolarStereo.fromstring,
-        "lambert": GridLambertConformal.fromstring,
-        "gaussian": GridGaussian.fromstring,
-    }.get(projname)
-    if not f:
+    cls = _WGRIB2_GRIDS.get(projname)
+    if not cls:
         raise ValueError("Invalid or unsupported projection: {:s}".format(projname))
-    return f(tokens, winds=winds, globe=globe)
+    return cls.fromstring(tokens, winds=winds, globe=globe)
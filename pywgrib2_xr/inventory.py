@@ -1,10 +1,16 @@
 import ast
-import copy
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 import hashlib
+import json
 import logging
+import numbers
+import operator
 import os
 import pickle
+import re
+import struct
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -16,6 +22,12 @@ from typing import (
     Union,
 )
 
+import numpy as np
+
+# For older Pythons, protocol 5 is needed for out-of-band buffers
+if pickle.HIGHEST_PROTOCOL < 5:
+    import pickle5 as pickle  # type: ignore
+
 try:
     import blosc
 except ImportError:
@@ -99,10 +111,7 @@ class MetaData:
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, self.__class__):
             return False
-        for s in self.__slots__:
-            if getattr(self, s) != getattr(other, s):
-                return False
-        return True
+        return _meta_values(self) == _meta_values(other)
 
     def __repr__(self) -> str:
         width = max([len(x) for x in self.__slots__])
@@ -123,6 +132,55 @@ class MetaData:
         return self.bot_level_value
 
 
+_meta_values = operator.attrgetter(*MetaData.__slots__)
+
+# MetaData attributes grouped by their storage in columnar inventory.
+_STR_COLUMNS = (
+    "offset",
+    "varname",
+    "level_str",
+    "time_str",
+    "centre",
+    "subcentre",
+    "long_name",
+    "units",
+)
+_INT_COLUMNS = (
+    "discipline",
+    "mastertab",
+    "localtab",
+    "pdt",
+    "parmcat",
+    "parmnum",
+    "bot_level_code",
+    "top_level_code",
+    "npts",
+    "nx",
+    "ny",
+    "gdtnum",
+)
+_TIME_COLUMNS = ("reftime", "start_ft", "end_ft")
+# Level values are int, float or None, stored as float64 and a type code.
+_VALUE_COLUMNS = ("bot_level_value", "top_level_value")
+_VALUE_TYPES = (type(None), int, float)
+
+
+def _value_kind(x: Any, name: str) -> int:
+    if x is None:
+        return 0
+    if isinstance(x, numbers.Integral):
+        return 1
+    if isinstance(x, numbers.Real):
+        return 2
+    raise TypeError("Invalid {:s}: {!r}".format(name, x))
+
+
+def _offsets(lengths: Sequence[int]) -> np.ndarray:
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
 class FileMetaData:
     file: Optional[str]
     meta: List[MetaData]
@@ -131,18 +189,77 @@ class FileMetaData:
         self.file = file
         self.meta = [self._copy(i) for i in inventory]
 
+    @classmethod
+    def from_columns(
+        cls, file: Optional[str], columns: Dict[str, np.ndarray]
+    ) -> "FileMetaData":
+        """Creates inventory from arrays returned by `to_columns`."""
+        values: Dict[str, List[Any]] = {}
+        for s in _STR_COLUMNS:
+            data = columns[s].tobytes()
+            bounds = columns[s + ".offsets"].tolist()
+            values[s] = [data[i:j].decode() for i, j in zip(bounds[:-1], bounds[1:])]
+        for s in _INT_COLUMNS:
+            values[s] = columns[s].tolist()
+        for s in _TIME_COLUMNS:
+            values[s] = columns[s].tolist()
+        for s in _VALUE_COLUMNS:
+            kinds = columns[s + ".kind"].tolist()
+            values[s] = [
+                _VALUE_TYPES[k](v) if k else None
+                for k, v in zip(kinds, columns[s].tolist())
+            ]
+        data = columns["gdtmpl"].tolist()
+        bounds = columns["gdtmpl.offsets"].tolist()
+        values["gdtmpl"] = [data[i:j] for i, j in zip(bounds[:-1], bounds[1:])]
+        slots = [s for s in MetaData.__slots__ if s != "file"]
+        obj = cls.__new__(cls)
+        obj.file = file
+        obj.meta = [
+            MetaData(**dict(zip(slots, row)))
+            for row in zip(*(values[s] for s in slots))
+        ]
+        return obj
+
+    def to_columns(self) -> Dict[str, np.ndarray]:
+        """Returns inventory as a dictionary of 1-D arrays.
+
+        Strings are stored as concatenated UTF-8 bytes and grid templates
+        as concatenated integers, each with an array of offsets.
+        """
+        columns: Dict[str, np.ndarray] = {}
+        for s in _STR_COLUMNS:
+            encoded = [getattr(i, s).encode() for i in self.meta]
+            columns[s] = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+            columns[s + ".offsets"] = _offsets([len(x) for x in encoded])
+        for s in _INT_COLUMNS:
+            columns[s] = np.array([getattr(i, s) for i in self.meta], dtype=np.int64)
+        for s in _TIME_COLUMNS:
+            columns[s] = np.array(
+                [getattr(i, s) for i in self.meta], dtype="datetime64[s]"
+            )
+        for s in _VALUE_COLUMNS:
+            items = [getattr(i, s) for i in self.meta]
+            columns[s + ".kind"] = np.array(
+                [_value_kind(x, s) for x in items], dtype=np.uint8
+            )
+            columns[s] = np.array(
+                [np.nan if x is None else x for x in items], dtype=np.float64
+            )
+        gdtmpls = [i.gdtmpl for i in self.meta]
+        columns["gdtmpl"] = np.array([x for g in gdtmpls for x in g], dtype=np.int64)
+        columns["gdtmpl.offsets"] = _offsets([len(g) for g in gdtmpls])
+        return columns
+
     def __repr__(self) -> str:
         if self.file:
             lines = ["<{:s}> {:s}".format(self.__class__.__name__, self.file)]
         else:
             lines = ["<{:s}>".format(self.__class__.__name__)]
         slots = MetaData.__slots__[1:]  # Skip 'file'
-        lines.extend(
-            [
-                "|".join(("{!s}={!s}".format(s, str(getattr(i, s))) for s in slots))
-                for i in self.meta
-            ]
-        )
+        fmt = "|".join(["{:s}={{!s}}".format(s) for s in slots])
+        getter = operator.attrgetter(*slots)
+        lines.extend([fmt.format(*getter(i)) for i in self.meta])
         return "\n".join(lines)
 
     def __str__(self) -> str:
@@ -151,12 +268,16 @@ class FileMetaData:
         else:
             lines = ["<{:s}>".format(self.__class__.__name__)]
         slots = ("offset", "varname", "level_str", "time_str", "reftime")
-        lines.extend(["|".join((str(getattr(i, s)) for s in slots)) for i in self.meta])
+        getter = operator.attrgetter(*slots)
+        lines.extend(["|".join(map(str, getter(i))) for i in self.meta])
         return "\n".join(lines)
 
     @staticmethod
     def _copy(meta, file=None):
-        newmeta = copy.copy(meta)
+        # Shallow copy, faster than copy.copy() for slotted class
+        newmeta = meta.__class__.__new__(meta.__class__)
+        for s, v in zip(MetaData.__slots__, _meta_values(meta)):
+            setattr(newmeta, s, v)
         newmeta.file = file
         return newmeta
 
@@ -189,26 +310,61 @@ def item_match(item, predicates=None):
 # Remove parantheses from level_str
 _trans_table = str.maketrans({"(": "", ")": ""})
 
+# Inventory line: offset (2 fields), varname, level_str, time_str, ..., pyinv dict
+_LINE_RE = re.compile(
+    r"^([^:\n]*:[^:\n]*):([^:\n]*):([^:\n]*):([^:\n]*):[^\n]*?pyinv=(\{.*\})$",
+    re.M,
+)
+# pyinv dict is a Python literal with single quoted strings. Without escapes
+# it translates to JSON, which is much faster to parse.
+_json_table = str.maketrans({"'": '"', '"': '\\"'})
+# None values, skipping quoted strings which may contain ':None,'
+_none_re = re.compile(r"('[^']*')|:None(?=[,}])")
 
-def _meta_from_string(file: str, s: str) -> MetaData:
-    # Will raise IndexError on invalid string
-    i = s.index("pyinv")
-    tok = s[:i].split(":")
-    d: Dict[str, Any] = {"file": file}
-    d["offset"] = ":".join(tok[:2])
-    d["varname"] = tok[2]
-    d["level_str"] = tok[3].translate(_trans_table)
-    d["time_str"] = tok[4]
-    d.update(ast.literal_eval(s[i + len("pyinv=") :]))
-    # Fix level string to eliminate slashes - messing up conversion to NetCDF.
-    level_code = d["bot_level_code"]
-    if level_code in (21, 22, 23, 24):
-        d["level_str"] = d["level_str"].replace("/m^3", "*m-3")
-    elif level_code == 109:
-        d["level_str"] = d["level_str"].replace("Km^2/kg/s", "K*m2*kg-1*s-1")
+
+def _none_to_null(m: "re.Match") -> str:
+    return m.group(1) or ":null"
+
+
+def _parse_pyinv(s: str) -> Dict[str, Any]:
+    if "\\" not in s:
+        try:
+            return json.loads(_none_re.sub(_none_to_null, s).translate(_json_table))
+        except ValueError:
+            pass
+    return ast.literal_eval(s)
+
+
+def _metas_from_string(file: str, s: str) -> List[MetaData]:
+    matches = list(_LINE_RE.finditer(s))
+    lines = [line for line in s.split("\n") if line]
+    if len(matches) != len(lines):
+        bad = next(line for line in lines if not _LINE_RE.fullmatch(line))
+        raise ValueError("Invalid inventory line: {:s}".format(bad))
+    items = []
+    for m in matches:
+        d: Dict[str, Any] = {"file": file}
+        d["offset"], d["varname"], level_str, d["time_str"] = m.group(1, 2, 3, 4)
+        d.update(_parse_pyinv(m.group(5)))
+        # Fix level string to eliminate slashes - messing up conversion to NetCDF.
+        level_str = level_str.translate(_trans_table)
+        level_code = d["bot_level_code"]
+        if level_code in (21, 22, 23, 24):
+            level_str = level_str.replace("/m^3", "*m-3")
+        elif level_code == 109:
+            level_str = level_str.replace("Km^2/kg/s", "K*m2*kg-1*s-1")
+        d["level_str"] = level_str
+        items.append(d)
     for k in ["reftime", "start_ft", "end_ft"]:
-        d[k] = datetime.fromisoformat(d[k])
-    return MetaData(**d)
+        times = np.array([d[k] for d in items], dtype="datetime64[s]").tolist()
+        for d, t in zip(items, times):
+            d[k] = t
+    return [MetaData(**d) for d in items]
+
+
+def _meta_from_string(file: str, s: str) -> MetaData:
+    # Will raise ValueError on invalid string
+    return _metas_from_string(file, s)[0]
 
 
 # def make_inventory(file: str) -> Union[None, List[MetaData]]:
@@ -228,7 +384,7 @@ def make_inventory(file):
     with MemoryBuffer() as buf:
         try:
             wgrib(file, "-rewind_init", file, "-inv", buf, "-pyinv")
-            return [_meta_from_string(file, s) for s in buf.get("s").split("\n") if s]
+            return _metas_from_string(file, buf.get("s"))
         except WgribError as e:
             logger.error("wgrib2 error: {!r}".format(e))
             return None
@@ -236,7 +392,10 @@ def make_inventory(file):
             free_files(file)
 
 
+@lru_cache(maxsize=1024)
 def inventory_name(file: str, directory: Optional[str] = None) -> str:
+    # The hash only names the file, it must not change between releases,
+    # otherwise existing inventories would be orphaned.
     ext = ".pinv" if blosc is None else ".binv"
     if directory:
         inv_file = hashlib.md5(file.encode()).hexdigest()
@@ -244,6 +403,75 @@ def inventory_name(file: str, directory: Optional[str] = None) -> str:
     return file + ext  # collocated with GRIB file
 
 
+# Columnar inventory file signature
+_BINV_MAGIC = b"PYWGRIB2INV\x03"
+
+
+def _write_frame(fp, buf) -> None:
+    view = memoryview(buf)
+    if view.nbytes == 0:
+        fp.write(struct.pack("<QQ", 0, 0))
+        return
+    # Bytes (strings, pickle stream) are best entropy coded by zstd,
+    # numeric columns compress well with bitshuffle.
+    if view.itemsize == 1:
+        opts = dict(cname="zstd", clevel=3, shuffle=blosc.NOSHUFFLE)
+    else:
+        opts = dict(cname="lz4", shuffle=blosc.BITSHUFFLE)
+    arr = np.frombuffer(buf, dtype=np.uint8)
+    packed = blosc.compress_ptr(
+        arr.__array_interface__["data"][0],
+        view.nbytes // view.itemsize,
+        typesize=view.itemsize,
+        **opts,
+    )
+    fp.write(struct.pack("<QQ", view.nbytes, len(packed)))
+    fp.write(packed)
+
+
+def _read_frame(fp) -> np.ndarray:
+    nbytes, size = struct.unpack("<QQ", fp.read(16))
+    arr = np.empty(nbytes, dtype=np.uint8)
+    if size:
+        blosc.decompress_ptr(fp.read(size), arr.__array_interface__["data"][0])
+    return arr
+
+
+def _write_columns(fp, file_inventory: FileMetaData) -> None:
+    # Column arrays are pickled out-of-band and compressed separately,
+    # so that blosc shuffles homogeneous items of the right size.
+    buffers: List[pickle.PickleBuffer] = []
+    main = pickle.dumps(
+        (file_inventory.file, file_inventory.to_columns()),
+        protocol=5,
+        buffer_callback=buffers.append,
+    )
+    fp.write(_BINV_MAGIC)
+    fp.write(struct.pack("<Q", len(buffers)))
+    _write_frame(fp, main)
+    for buf in buffers:
+        _write_frame(fp, buf)
+
+
+def _read_columns(fp) -> Optional[FileMetaData]:
+    if fp.read(len(_BINV_MAGIC)) != _BINV_MAGIC:
+        return None
+    (nbuffers,) = struct.unpack("<Q", fp.read(8))
+    main = _read_frame(fp)
+    buffers = [_read_frame(fp) for _ in range(nbuffers)]
+    file, columns = pickle.loads(main, buffers=buffers)
+    return FileMetaData.from_columns(file, columns)
+
+
+def _is_stale(inv_file: str, file: str) -> bool:
+    # Inventory is stale when GRIB file was modified after inventory was saved.
+    # GRIB file might not be accessible, then trust the inventory.
+    try:
+        return os.stat(inv_file).st_mtime_ns < os.stat(file).st_mtime_ns
+    except OSError:
+        return False
+
+
 def save_inventory(
     inventory: Sequence[MetaData], file: str, directory: Optional[str] = None
 ) -> None:
@@ -271,12 +499,8 @@ def save_inventory(
             with open(inv_file, "wb") as fp:
                 pickle.dump(file_inventory, fp)
         else:
-            arr = pickle.dumps(file_inventory)
-            packed = blosc.compress(
-                arr, typesize=8, cname="lz4", shuffle=blosc.BITSHUFFLE
-            )
             with open(inv_file, "wb") as fp:
-                fp.write(packed)
+                _write_columns(fp, file_inventory)
     except OSError as e:
         logger.error("Cannot save inventory to file {:s}: {!r}".format(inv_file, e))
         # raise
@@ -299,15 +523,21 @@ def load_inventory(
     -------
     inventory: list
         List of MetaData for all messages in a GRIB2 file. In case of an error,
-        None is returned.
+        or when the GRIB2 file is newer than the inventory, None is returned.
     """
     inv_file = inventory_name(file, directory)
+    if _is_stale(inv_file, file):
+        logger.info("Inventory {:s} is older than {:s}".format(inv_file, file))
+        return None
     try:
         with open(inv_file, "rb") as fp:
-            data = fp.read()
-            if blosc is not None:
-                data = blosc.decompress(data)
-            file_inventory = pickle.loads(data)
+            if blosc is None:
+                file_inventory = pickle.load(fp)
+            else:
+                file_inventory = _read_columns(fp)
+                if file_inventory is None:
+                    logger.info("Unknown inventory format in {:s}".format(inv_file))
+                    return None
             return file_inventory.to_meta(file)
     except OSError as e:
         logger.info("Cannot load inventory from {:s}: {!r}".format(inv_file, e))
@@ -327,7 +557,8 @@ def load_or_make_inventory(
         Directory of the inventory file, if not collocated with GRIB2 file.
         Default is None.
     save : bool
-        Save created inventory, if inventory file does not exist. Default is False.
+        Save created inventory, if inventory file does not exist or is older than
+        the GRIB2 file. Default is False.
 
     Returns
     -------
@@ -346,3 +577,54 @@ def load_or_make_inventory(
     if inventory and save:
         save_inventory(inventory, file, directory)
     return inventory
+
+
+def load_or_make_inventory_many(
+    files: Sequence[str],
+    directory: Optional[str] = None,
+    save: Optional[bool] = False,
+    max_workers: Optional[int] = None,
+) -> List[Union[None, List[MetaData]]]:
+    """Returns inventories for a sequence of GRIB2 files.
+
+    Saved inventories are loaded concurrently in a thread pool, blosc
+    releases the GIL while decompressing. Missing or stale inventories
+    are created sequentially, `wgrib2` is not thread safe.
+
+    Parameters
+    ----------
+    files : sequence of str
+        GRIB file paths.
+    directory : str, optional
+        Directory of the inventory files, if not collocated with GRIB2 files.
+        Default is None.
+    save : bool
+        Save created inventories. Default is False.
+    max_workers : int, optional
+        Number of threads. Default is chosen by ThreadPoolExecutor.
+
+    Returns
+    -------
+    inventories: list
+        Inventory for each file, as returned by load_or_make_inventory.
+
+    See also
+    --------
+    pywgrib2_xr.load_or_make_inventory
+    """
+    files = list(files)
+    releasegil = blosc.set_releasegil(True) if blosc is not None else None
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            inventories = list(
+                executor.map(partial(load_inventory, directory=directory), files)
+            )
+    finally:
+        if blosc is not None:
+            blosc.set_releasegil(releasegil)
+    for n, file in enumerate(files):
+        if not inventories[n]:
+            inventories[n] = make_inventory(file)
+            if inventories[n] and save:
+                save_inventory(inventories[n], file, directory)
+    return inventories
@@ -1,4 +1,5 @@
-from typing import Any, Optional, Sequence, Union
+from functools import lru_cache
+from typing import Any, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
@@ -17,9 +18,33 @@ IP_Types = dict(bilinear=0, bicubic=1, neighbor=2, neighbour=2, budget=3, spectr
 # Interpolation options array size
 IPOPT_SIZE = 20
 
+# iplib keeps saved state between calls (e.g. interpolation weights for
+# the last grid pair), calls must be serialized.
 IP_LOCK = SerializableLock()
 
 
+def set_releasegil(flag: bool) -> bool:
+    """Releases the GIL during `iplib` interpolation.
+
+    Other Python threads can run while the interpolation is in progress.
+    The ``*_grid`` and ``*_points`` functions serialize calls with
+    ``IP_LOCK``; direct callers of `ipolates` and `ipolatev` from several
+    threads must hold ``IP_LOCK`` themselves. The GIL is released when
+    the module is imported.
+
+    Parameters
+    ----------
+    flag : bool
+        Whether to release the GIL.
+
+    Returns
+    -------
+    bool
+        Previous setting.
+    """
+    return _wgrib2.set_releasegil(flag)
+
+
 def gdswzd(
     gdtnum: int,
     gdtmpl: ArrayLike,
@@ -31,11 +56,9 @@ def gdswzd(
 ):
     crot = np.empty_like(xpts)
     srot = np.empty_like(xpts)
-    xlon = np.empty_like(xpts)
-    xlat = np.empty_like(xpts)
-    ylon = np.empty_like(xpts)
-    ylat = np.empty_like(xpts)
     area = np.empty_like(xpts)
+    # Map jacobian is discarded, one block for all four.
+    xlon, xlat, ylon, ylat = np.empty((4,) + xpts.shape, dtype=xpts.dtype)
     nret = _wgrib2.gdswiz(
         gdtnum,
         gdtmpl,
@@ -125,6 +148,16 @@ def grid2earth_grid(grid):
         return gdswzd(grid.gdtnum, gdtmpl, 0, xpts, ypts, lon, lat)
 
 
+@lru_cache(maxsize=4)
+def _grid_rotation(grid) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns shared, read-only (crot, srot) for `grid`."""
+    ret = grid2earth_grid(grid)
+    crot, srot = ret["crot"], ret["srot"]
+    crot.flags.writeable = False
+    srot.flags.writeable = False
+    return crot, srot
+
+
 def grid2earth_points(grid, xpts, ypts):
     """Computes Earth coordinates of selected grid points.
 
@@ -186,7 +219,10 @@ def ipolates(
     rlat: Union[Sequence[float], ArrayLike, None] = None,
     ipopt: Optional[Any] = None,
 ):
-    """Interface to `iplib` subroutine `ipolates`."""
+    """Interface to `iplib` subroutine `ipolates`.
+
+    Calls from several threads must be serialized with ``IP_LOCK``.
+    """
     ip = IP_Types.get(iptype)
     if ip is None:
         raise ValueError("Invalid interpolation type")
@@ -223,12 +259,10 @@ def ipolates(
         m_out = rlon.size
         shape_out = tuple(list(grid.shape[:-2]) + [m_out])
     g_in = np.ascontiguousarray(grid, dtype=DTYPE).ravel()
-    l_in = np.ones((g_in.size,), dtype=np.uint8)
-    l_in[np.isnan(g_in)] = 0
-    if np.all(l_in):
-        ib_in = np.zeros((km,), dtype=np.int32)
-    else:
-        ib_in = np.ones((km,), dtype=np.int32)
+    missing = np.isnan(g_in)
+    # Bitmap is 1 for valid points, used only if ib_in is set
+    l_in = np.logical_not(missing, out=missing).view(np.uint8)
+    ib_in = np.full((km,), not l_in.all(), dtype=np.int32)
     ib_out = np.empty((km,), dtype=np.int32)
     g_out = np.empty((km * m_out,), dtype=DTYPE)
     l_out = np.empty((g_out.size,), dtype=np.uint8)
@@ -259,7 +293,7 @@ def ipolates(
         }.get(iret, "Interpolation failed, reason: {:d}".format(iret))
         raise WgribError(msg)
     if not np.all(ib_out == 0):
-        g_out[l_out & 1 == 0] = np.nan
+        np.copyto(g_out, np.nan, where=l_out & 1 == 0)
     if gdtnum_out < 0:
         return dict(data=g_out.reshape(shape_out))
     return dict(
@@ -379,7 +413,10 @@ def ipolatev(
     rlat: Union[Sequence[float], ArrayLike, None] = None,
     ipopt: Optional[Sequence[int]] = None,
 ):
-    """Interface to NCEP subroutine `ipolatev`."""
+    """Interface to NCEP subroutine `ipolatev`.
+
+    Calls from several threads must be serialized with ``IP_LOCK``.
+    """
     ip = IP_Types.get(iptype)
     if ip is None:
         raise WgribError("Invalid interpolation type")
@@ -419,12 +456,11 @@ def ipolatev(
         shape_out = tuple(list(udata.shape[:-2]) + [m_out])
     ug_in = np.ascontiguousarray(udata, dtype=DTYPE).ravel()
     vg_in = np.ascontiguousarray(vdata, dtype=DTYPE).ravel()
-    l_in = np.ones((ug_in.size,), dtype=np.uint8)
-    l_in[np.isnan(ug_in) | np.isnan(vg_in)] = 0
-    if np.all(l_in):
-        ib_in = np.zeros((km,), dtype=np.int32)
-    else:
-        ib_in = np.ones((km,), dtype=np.int32)
+    missing = np.isnan(ug_in)
+    missing |= np.isnan(vg_in)
+    # Bitmap is 1 for valid points, used only if ib_in is set
+    l_in = np.logical_not(missing, out=missing).view(np.uint8)
+    ib_in = np.full((km,), not l_in.all(), dtype=np.int32)
     ug_out = np.empty((km * m_out,), dtype=DTYPE)
     vg_out = np.empty((km * m_out,), dtype=DTYPE)
     crot = np.empty((m_out,), dtype=DTYPE)
@@ -463,8 +499,8 @@ def ipolatev(
         raise WgribError(msg)
     if not np.all(ib_out == 0):
         m = l_out & 1 == 0
-        ug_out[m] = np.nan
-        vg_out[m] = np.nan
+        np.copyto(ug_out, np.nan, where=m)
+        np.copyto(vg_out, np.nan, where=m)
     if gdtnum_out < 0:
         return dict(
             udata=ug_out.reshape(shape_out),
@@ -589,8 +625,13 @@ def ipv_points(udata, vdata, iptype, grid, point, windNS=False, ipopt=None):
             )
     # FIXME: should be grid?
     if windNS and grid.params["GRIB_winds"] == "grid":
-        return {
-            "udata": ret["crot"] * ret["udata"] - ret["srot"] * ret["vdata"],
-            "vdata": ret["srot"] * ret["udata"] + ret["crot"] * ret["vdata"],
-        }
+        crot, srot, u, v = ret["crot"], ret["srot"], ret["udata"], ret["vdata"]
+        # Allocates the new u and one scratch array, v is rotated in place
+        urot = np.multiply(crot, u)
+        tmp = np.multiply(srot, v)
+        urot -= tmp
+        np.multiply(srot, u, out=tmp)
+        v *= crot
+        v += tmp
+        return {"udata": urot, "vdata": v}
     return {"udata": ret["udata"], "vdata": ret["vdata"]}
@@ -1,5 +1,8 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 import logging
+from typing import FrozenSet
 
 import numpy as np
 
@@ -8,6 +11,42 @@ from .wgrib2 import MemoryBuffer, RPNRegister, wgrib, free_files
 
 logger = logging.getLogger(__name__)
 
+# Input files kept open by wgrib2 between calls, see open_grib()
+_open_files: "ContextVar[FrozenSet[str]]" = ContextVar(
+    "_open_files", default=frozenset()
+)
+
+
+@contextmanager
+def open_grib(gribfile):
+    """Keeps GRIB2 file open by `wgrib2` while reading messages.
+
+    Within the context, :py:func:`read_msg`, :py:func:`decode_msg` (and their
+    batched versions) and :py:func:`write_msg` (as template file) do not close
+    `gribfile` after each call. The file is closed on exit.
+
+    Parameters
+    ----------
+    gribfile : str
+        Source GRIB2 file.
+
+    Examples
+    --------
+    >>> with open_grib(gribfile):
+    ...     arrays = [decode_msg(gribfile, m) for m in inventory]
+    """
+    token = _open_files.set(_open_files.get() | {gribfile})
+    try:
+        yield gribfile
+    finally:
+        _open_files.reset(token)
+        free_files(gribfile)
+
+
+def _free_input(gribfile):
+    if gribfile not in _open_files.get():
+        free_files(gribfile)
+
 
 def read_msg(gribfile, num_or_meta):
     """Returns single message from GRIB2 file as bytes.
@@ -51,7 +90,7 @@ def read_msg(gribfile, num_or_meta):
         except WgribError:
             raise
         finally:
-            free_files(gribfile)
+            _free_input(gribfile)
 
 
 def decode_msg(gribfile, meta):
@@ -94,7 +133,159 @@ def decode_msg(gribfile, meta):
         except WgribError:
             raise
         finally:
-            free_files(gribfile)
+            _free_input(gribfile)
+
+
+def _offsets_buffer(metas):
+    # wgrib2 inventory for -i_file: one "msgno:byte_offset" line per message
+    buf = MemoryBuffer()
+    buf.set("\n".join(m.offset for m in metas))
+    return buf
+
+
+def read_msgs(gribfile, metas):
+    """Returns selected messages from GRIB2 file as bytes.
+
+    Messages are extracted in one `wgrib2` invocation.
+
+    Parameters
+    ----------
+    gribfile : str or MemoryBuffer
+        Source file.
+    metas : sequence of MetaData
+        MetaData for the messages.
+
+    Returns
+    -------
+    msgs : list of bytes
+        Undecoded GRIB2 messages, in the order of `metas`.
+
+    Raises
+    ------
+    pywgrib2_xr.WgribError
+        When wgrib call fails or returns malformed data.
+    """
+    if not metas:
+        return []
+    inventory = _offsets_buffer(metas)
+    with MemoryBuffer() as buf:
+        args = [
+            gribfile,
+            "-rewind_init",
+            gribfile,
+            "-i_file",
+            inventory,
+            "-rewind_init",
+            inventory,
+            "-inv",
+            "/dev/null",
+            "-grib",
+            buf,
+        ]
+        try:
+            wgrib(*args)
+            data = buf.get()
+        except WgribError:
+            raise
+        finally:
+            inventory.close()
+            _free_input(gribfile)
+    # Split on message length in section 0
+    msgs = []
+    start = 0
+    while start < len(data):
+        length = int.from_bytes(data[start + 8 : start + 16], "big")
+        end = start + length
+        if length < 16 or end > len(data):
+            raise WgribError("Invalid GRIB message length at {:d}".format(start))
+        msgs.append(data[start:end])
+        start = end
+    if len(msgs) != len(metas):
+        raise WgribError(
+            "Expected {:d} messages, got {:d}".format(len(metas), len(msgs))
+        )
+    return msgs
+
+
+def decode_msgs(gribfile, metas):
+    """Returns decoded messages from GRIB2 file as numpy arrays.
+
+    Messages are decoded in one `wgrib2` invocation.
+
+    Parameters
+    ----------
+    gribfile : str or MemoryBuffer
+        Source file.
+    metas : sequence of MetaData
+        MetaData for the messages.
+
+    Returns
+    -------
+    arrs : list of np.ndarray
+        GRIB2 message data, in the order of `metas`.
+
+    Raises
+    ------
+    pywgrib2_xr.WgribError
+        When wgrib call fails or returns malformed data.
+    """
+    if not metas:
+        return []
+    inventory = _offsets_buffer(metas)
+    with MemoryBuffer() as buf:
+        args = [
+            gribfile,
+            "-rewind_init",
+            gribfile,
+            "-i_file",
+            inventory,
+            "-rewind_init",
+            inventory,
+            "-inv",
+            "/dev/null",
+            "-no_header",
+            "-bin",
+            buf,
+        ]
+        try:
+            wgrib(*args)
+            values = buf.get("a")
+        except WgribError:
+            raise
+        finally:
+            inventory.close()
+            _free_input(gribfile)
+    size = sum(m.ny * m.nx for m in metas)
+    if values.size != size:
+        raise WgribError("Expected {:d} values, got {:d}".format(size, values.size))
+    arrs = []
+    start = 0
+    for m in metas:
+        end = start + m.ny * m.nx
+        arrs.append(values[start:end].reshape((m.ny, m.nx)))
+        start = end
+    return arrs
+
+
+def _fmt_date(v) -> str:
+    if isinstance(v, str):
+        v = datetime.fromisoformat(v)
+    return "{:04d}{:02d}{:02d}{:02d}{:02d}{:02d}".format(
+        v.year, v.month, v.day, v.hour, v.minute, v.second
+    )
+
+
+# write_msg keyword: wgrib2 option, value formatter.
+# metadata is first source, var, lev are applied afterwards.
+_SET_OPTIONS = (
+    ("metadata", "-set_metadata_str", None),
+    ("date", "-set_date", _fmt_date),
+    ("var", "-set_var", None),
+    ("lev", "-set_lev", None),
+    ("ftime", "-set_ftime", None),
+    ("grib_type", "-set_grib_type", None),
+)
+_WRITE_KWARGS = frozenset([k for k, _, _ in _SET_OPTIONS] + ["bin_prec"])
 
 
 def write_msg(gribfile, tmplfile, num_or_meta, data=None, append=False, **kwargs):
@@ -146,32 +337,15 @@ def write_msg(gribfile, tmplfile, num_or_meta, data=None, append=False, **kwargs
     else:
         offset = num_or_meta.offset
     args = [tmplfile, "-rewind_init", tmplfile, "-d", offset, "-inv", "/dev/null"]
-    valid_args = set(
-        ["metadata", "date", "var", "lev", "ftime", "grib_type", "bin_prec"]
-    )
+    unknown = kwargs.keys() - _WRITE_KWARGS
+    if unknown:
+        logger.warning("Ignored arguments: {:s}".format(", ".join(sorted(unknown))))
     out = "-grib" if data is None else "-grib_out"
-    # metadata is first source, var, lev are applied afterwards
-    if "metadata" in kwargs:
-        v = kwargs.pop("metadata")
-        args.extend(["-set_metadata_str", v])
-    if "date" in kwargs:
-        v = kwargs.pop("date")
-        if isinstance(v, str):
-            v = datetime.fromisoformat(v)
-        v = v.strftime("%Y%m%d%H%M%S")
-        args.extend(["-set_date", v])
-    if "var" in kwargs:
-        v = kwargs.pop("var")
-        args.extend(["-set_var", v])
-    if "lev" in kwargs:
-        v = kwargs.pop("lev")
-        args.extend(["-set_lev", v])
-    if "ftime" in kwargs:
-        v = kwargs.pop("ftime")
-        args.extend(["-set_ftime", v])
+    for key, option, fmt in _SET_OPTIONS:
+        if key in kwargs:
+            v = kwargs[key]
+            args.extend([option, fmt(v) if fmt else v])
     if "grib_type" in kwargs:
-        v = kwargs.pop("grib_type")
-        args.extend(["-set_grib_type", v])
         out = "-grib_out"
 
     try:
@@ -179,16 +353,22 @@ def write_msg(gribfile, tmplfile, num_or_meta, data=None, append=False, **kwargs
         # -rpn will clear scaling parameters, so set grid point data first
         if data is not None:
             reg = RPNRegister()
-            data = np.asarray(data)
-            data[np.isnan(data)] = UNDEFINED
-            reg.set(data)
+            # No copy for float32 input without missing values,
+            # caller's array is never modified.
+            arr = np.asarray(data, dtype=np.float32)
+            missing = np.isnan(arr)
+            if missing.any():
+                if np.may_share_memory(arr, data):
+                    arr = np.where(missing, np.float32(UNDEFINED), arr)
+                else:
+                    np.copyto(arr, UNDEFINED, where=missing)
+            reg.set(arr)
             args.extend(["-rpn_rcl", reg])
         else:
             reg = None
         if "bin_prec" in kwargs:
             args.extend(["-set_grib_max_bits", 24])
-            v = kwargs.pop("bin_prec")
-            args.extend(["-set_bin_prec", v])
+            args.extend(["-set_bin_prec", kwargs["bin_prec"]])
         if append:
             args.append("-append")
         args.extend([out, gribfile])
@@ -196,7 +376,8 @@ def write_msg(gribfile, tmplfile, num_or_meta, data=None, append=False, **kwargs
     except WgribError:
         raise
     finally:
-        free_files(tmplfile, gribfile)
+        _free_input(tmplfile)
+        free_files(gribfile)
         if reg is not None:
             reg.close()
         
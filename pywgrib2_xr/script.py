@@ -59,7 +59,8 @@ where:
                     Directory for inventory files. Will be created if does not exist.
                     Intended for read-only GRIB directories.
                 -n num-procs
-                    Number of processes in multiprocessing mode. Default is 1.
+                    Number of processes in multiprocessing mode, at most the
+                    number of CPUs. 0 means number of CPUs. Default is 1.
                 -p pattern
                     "glob.glob" pattern.
                 -r
@@ -179,14 +180,35 @@ def _f(p, d):
     save_inventory(make_inventory(p), p, d)
 
 
+def _prefetch(file: str) -> None:
+    # wgrib2 walks message headers through the whole file. Ask the kernel
+    # to start readahead, so that the file is in the page cache when
+    # a worker picks it up.
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(file, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 def make_inv(args: List[str]) -> None:
     opts, pargs = getopt.getopt(args, "hi:n:p:")
     kwds = dict(opts)
     recursive = "-r" in kwds
     inv_dir = kwds.get("-i")
-    num_processes = int(kwds.get("-n", 1))
-    if not 1 <= num_processes <= 4:
-        raise ValueError("Number of processes must be between 1 and 4")
+    num_cpus = os.cpu_count() or 1
+    num_processes = int(kwds.get("-n", 1)) or num_cpus
+    if not 1 <= num_processes <= num_cpus:
+        raise ValueError(
+            "Number of processes must be between 1 and {:d}".format(num_cpus)
+        )
     pattern = kwds.get("-p")
     if pattern:
         files = [
@@ -201,11 +223,23 @@ def make_inv(args: List[str]) -> None:
     fun = partial(_f, d=inv_dir)
 
     if num_processes == 1:
-        for file in files:
+        for i, file in enumerate(files, 1):
+            if i < len(files):
+                _prefetch(files[i])
             fun(file)
     else:
+        # Results are not needed, do not collect them in order
+        chunksize = min(max(1, len(files) // (num_processes * 4)), 8)
+        # Prefetch only files about to be processed: chunks handed out to
+        # workers, and two more files per worker. Files are dispatched in order.
+        window = num_processes * (chunksize + 2)
+        for file in files[:window]:
+            _prefetch(file)
         with Pool(num_processes) as pool:
-            pool.map(fun, files)
+            results = pool.imap_unordered(fun, files, chunksize=chunksize)
+            for i, _ in enumerate(results, window):
+                if i < len(files):
+                    _prefetch(files[i])
 
 
 def cat_inv(args: List[str]) -> None:
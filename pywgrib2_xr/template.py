@@ -30,9 +30,9 @@ from . import __version__, _Variable
 from .inventory import (
     MetaData,
     item_match,
-    load_or_make_inventory,
+    load_or_make_inventory_many,
 )
-from .grids import grid_fromgds
+from .grids import _grid_fromgds
 
 # FIME: remove?
 # wgrib2 returns C float arrays
@@ -174,7 +174,7 @@ class Template:
         else:
             predicates = list(predicates)
         self.commoninfo = commoninfo
-        self.grid = grid_fromgds(commoninfo.gdtnum, commoninfo.gdtmpl)
+        self.grid = _grid_fromgds(commoninfo.gdtnum, tuple(commoninfo.gdtmpl))
         self.coords = {k: _Variable(*v) for k, v in self.grid.coords.items()}
         level_dims, level_coords, level_var2coord = self._build_level_coords(
             var_info_map
@@ -397,8 +397,7 @@ def make_template(
     vert_level_map = {c: v for c, v in VERT_LEVELS.items() if v.type in vertlevels}
     var_info_map: Dict[str, VarInfo] = {}
     commoninfo = None
-    for file in files:
-        inventory = load_or_make_inventory(file, save=save, directory=invdir)
+    for inventory in load_or_make_inventory_many(files, invdir, save):
         if not inventory:
             continue
         matched_items = (i for i in inventory if item_match(i, predicates))
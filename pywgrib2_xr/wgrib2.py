@@ -137,6 +137,12 @@ class MemoryBuffer:
             Return type. One of 'a' - np.ndarray, 'b' - bytes, 's' - str.
             Default is 'b'.
         """
+        if rtype == "a":
+            # Avoid creating bytes object, copy directly to array
+            arr = _wgrib2.get_mem_buf_array(self._n)
+            if arr is None:
+                raise WgribError("wgrib2_get_mem_buffer failed")
+            return arr.view(np.float32)
         bytes = _wgrib2.get_mem_buf(self._n)
         if bytes is None:
             raise WgribError("wgrib2_get_mem_buffer failed")
@@ -144,8 +150,6 @@ class MemoryBuffer:
             return bytes
         elif rtype == "s":
             return bytes.decode()
-        elif rtype == "a":
-            return np.frombuffer(bytes, dtype=np.float32)
         else:
             raise ValueError(
                 "Invalid argument {:s}, must be 'a', 'b' or 's')".format(rtype)
@@ -359,8 +363,9 @@ def latlon2xy(sec3, grid_lon, grid_lat, lon, lat):
     WgribError
         When the C function exits with non-zero status.
     """
-    grid_lon = grid_lon.astype(np.float64)
-    grid_lat = grid_lat.astype(np.float64)
+    # Avoid copying grid coordinates, they are already contiguous float64
+    grid_lon = np.ascontiguousarray(grid_lon, dtype=np.float64).ravel()
+    grid_lat = np.ascontiguousarray(grid_lat, dtype=np.float64).ravel()
     lon = np.atleast_1d(lon).astype(np.float64)
     lat = np.atleast_1d(lat).astype(np.float64)
 
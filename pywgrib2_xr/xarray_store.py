@@ -15,7 +15,7 @@ from xarray.backends.common import AbstractDataStore, BackendArray
 from xarray.backends.locks import SerializableLock, ensure_lock
 
 from .wgrib2 import free_files, status_open
-from .inventory import MetaData, load_or_make_inventory
+from .inventory import MetaData, load_or_make_inventory_many
 from .template import Template
 
 WGRIB2_LOCK = SerializableLock()
@@ -205,8 +205,7 @@ def open_dataset(
     def combine_files(files):
         # Create list of MetaData items grouped and sorted by reference time
         d = defaultdict(list)
-        for file in files:
-            inventory = load_or_make_inventory(file, invdir, save=save)
+        for inventory in load_or_make_inventory_many(files, invdir, save):
             if not inventory:
                 continue
             for i in (i for i in inventory if template.item_match(i)):
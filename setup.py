@@ -54,6 +54,7 @@ INSTALL_REQUIRES = [
 ]
 if sys.version_info < (3, 8): 
     INSTALL_REQUIRES.append("mypy_extensions >= 0.4.3")
+    INSTALL_REQUIRES.append("pickle5 >= 0.0.10")
 TESTS_REQUIRE = ["pytest >= 3", "netcdf4 >= 1.4"]
 
 numpy_incdir = numpy.get_include()
@@ -41,6 +41,10 @@ def test_dataset_winds():
         ds2["VGRD.10_m_above_ground"].values, expected_v, rtol=2.0e-2, atol=5e-2
     )
     assert ds2.wgrib2.get_grid().params["GRIB_winds"] == "earth"
+    # Shared source grid is not modified
+    assert ds.wgrib2.get_grid().params["GRIB_winds"] == "grid"
+    ds.wgrib2.get_grid().set_winds("earth")
+    assert ds.wgrib2.get_grid().params["GRIB_winds"] == "grid"
 
 
 def test_dataset_location():
@@ -1,3 +1,5 @@
+import pytest
+
 from pywgrib2_xr.grids import (
     GDTNum,
     GridLatLon,
@@ -7,6 +9,7 @@ from pywgrib2_xr.grids import (
     GridLambertConformal,
     GridGaussian,
     GridSpaceView,
+    Point,
     grid_fromstring,
 )
 
@@ -292,6 +295,25 @@ def test_grids_latlon_gds():
     assert_dict_equal(grid.globe, expected_globe)
 
 
+def test_grids_latlon_scan_ns():
+    gdtmpl = gdtmpl_latlon.copy()
+    gdtmpl[11], gdtmpl[14] = gdtmpl[14], gdtmpl[11]
+    gdtmpl[18] = 0
+    grid = GridLatLon(gdtmpl)
+    assert_dict_equal(grid.params, params_latlon)
+
+
+def test_grids_eq_hash():
+    grid1 = GridLatLon(gdtmpl_latlon)
+    grid2 = GridLatLon(gdtmpl_latlon)
+    grid3 = GridGaussian(gdtmpl_gaussian)
+
+    assert grid1 == grid1
+    assert grid1 == grid2 and hash(grid1) == hash(grid2)
+    assert grid1 != grid3
+    assert len({grid1, grid2, grid3}) == 2
+
+
 def test_grids_latlon_fromstring():
     s = "latlon 0:720:0.5 -90:361:0.5"
 
@@ -377,3 +399,10 @@ def test_grids_space_view():
     print(grid.params)
     assert_dict_equal(grid.params, params_space_view)
     assert_dict_equal(grid.globe, expected_globe)
+
+
+def test_point_shape_mismatch():
+    with pytest.raises(ValueError):
+        Point([0.0, 1.0], [0.0])
+    with pytest.raises(ValueError):
+        Point([0.0, 1.0], [0.0, 1.0], ("station", [1, 2, 3], {}))
@@ -1,3 +1,4 @@
+import ast
 import datetime
 import os
 import re
@@ -10,8 +11,11 @@ from pywgrib2_xr.inventory import (
     make_inventory,
     save_inventory,
     load_inventory,
+    load_or_make_inventory_many,
     inventory_name,
     item_match,
+    _parse_pyinv,
+    _metas_from_string,
 )
 
 from . import path_to
@@ -80,6 +84,33 @@ def test_file_inventory(geps_inventory):
     assert str(file_meta) == expected.strip()
 
 
+def test_file_inventory_columns(geps_inventory):
+    file_meta = FileMetaData(None, geps_inventory)
+    columns = file_meta.to_columns()
+    assert columns["gdtmpl.offsets"][-1] == columns["gdtmpl"].size
+    restored = FileMetaData.from_columns(None, columns)
+    assert restored.to_meta(path_to(grib_file)) == geps_inventory
+
+
+def test_parse_pyinv():
+    s = "{'centre':'7 - NCEP','bot_level_value':0.5,'top_level_value':None}"
+    expected = {"centre": "7 - NCEP", "bot_level_value": 0.5, "top_level_value": None}
+    assert _parse_pyinv(s) == expected
+    # Not valid JSON, parsed as Python literal
+    assert _parse_pyinv("{'bot_level_value':.5}") == {"bot_level_value": 0.5}
+    # Quotes and backslashes must parse as Python literals do
+    for value in ["a\\b", "it's", 'say "hi"', "a:None,b", "a:None}"]:
+        s = "{{'long_name':{!r},'units':None}}".format(value)
+        assert _parse_pyinv(s) == ast.literal_eval(s)
+    s = r"{'long_name':'it\'s \\ \"hi\"'}"
+    assert _parse_pyinv(s) == ast.literal_eval(s)
+
+
+def test_metas_invalid_line():
+    with pytest.raises(ValueError, match="Invalid inventory line"):
+        _metas_from_string("f", "1:0:TMP:2 m above ground:anl:no inventory\n")
+
+
 def test_search_inventory_one(geps_inventory):
     def predicate(x):
         return x.varname == "TMP.max_all_members"
@@ -182,3 +213,31 @@ def test_save_inventory(directory):
         os.rmdir(directory)
 
     assert inventory_saved == inventory
+
+
+def test_load_stale_inventory(tmpdir):
+    gribfile = path_to("CMC_glb_ps30km_2020012512.grib2")
+    directory = str(tmpdir)
+
+    inventory = make_inventory(gribfile)
+    save_inventory(inventory, gribfile, directory)
+    inventory_file = inventory_name(gribfile, directory)
+    assert load_inventory(gribfile, directory) == inventory
+
+    # Inventory older than GRIB file
+    os.utime(inventory_file, (0, 0))
+    assert load_inventory(gribfile, directory) is None
+
+
+def test_load_or_make_inventory_many(tmpdir):
+    gribfiles = [
+        path_to("CMC_glb_ps30km_2020012512.grib2"),
+        path_to("CMC_glb_TMP_ISBL_1000_ps30km_P000.grib2"),
+    ]
+    directory = str(tmpdir)
+
+    save_inventory(make_inventory(gribfiles[0]), gribfiles[0], directory)
+    inventories = load_or_make_inventory_many(gribfiles, directory, save=True)
+
+    assert inventories == [make_inventory(f) for f in gribfiles]
+    assert load_inventory(gribfiles[1], directory) == inventories[1]
@@ -7,8 +7,11 @@ from pywgrib2_xr import (
     wgrib,
     free_files,
     make_inventory,
+    open_grib,
     read_msg,
+    read_msgs,
     decode_msg,
+    decode_msgs,
     write_msg,
 )
 
@@ -34,6 +37,32 @@ def test_decode():
     assert abs(array.mean() - expected_mean) < 1e-3
 
 
+def test_read_decode_many():
+    infile = path_to("gfs_tsoil.grib2")
+    inv = make_inventory(infile)
+    metas = inv[::-1]
+
+    msgs = read_msgs(infile, metas)
+    arrays = decode_msgs(infile, metas)
+
+    assert msgs == [read_msg(infile, m) for m in metas]
+    assert len(arrays) == len(metas)
+    for a, m in zip(arrays, metas):
+        assert np.array_equal(a, decode_msg(infile, m))
+
+
+def test_open_grib():
+    infile = path_to("gfs_tsoil.grib2")
+    inv = make_inventory(infile)
+    expected = [decode_msg(infile, m) for m in inv]
+
+    with open_grib(infile):
+        arrays = [decode_msg(infile, m) for m in inv]
+
+    for a, e in zip(arrays, expected):
+        assert np.array_equal(a, e)
+
+
 def test_write(tmpdir):
     outfile = os.path.join(tmpdir, "rh1.grib2")
     write_msg(outfile, gribfile, 1, date="2020-11-03", ftime="6 hour fcst")
@@ -54,6 +83,19 @@ def test_write_data(tmpdir):
     assert inv[0].varname == "RH"
 
 
+def test_write_data_nan(tmpdir):
+    nx, ny = 247, 200
+    data = np.full((ny, nx), 50.0, dtype=np.float32)
+    data[0, :10] = np.nan
+    outfile = os.path.join(tmpdir, "rh3.grib2")
+    write_msg(outfile, gribfile, 1, data, var="RH", bin_prec=7)
+    inv = make_inventory(outfile)
+    array = decode_msg(outfile, inv[0])
+
+    assert np.isnan(data[0, :10]).all()  # input is unchanged
+    assert (array[0, :10] > 1e20).all()  # wgrib2 UNDEFINED
+
+
 def test_roundtrip(tmpdir):
     infile = path_to('gfs_tsoil.grib2')
     outfile = os.path.join(tmpdir, "t_soil.grib2")
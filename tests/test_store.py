@@ -91,6 +91,15 @@ def test_xarray_open_dataset(template, tmpdir):
     assert_dict_equal(ds[expected_projection].attrs, expected_projection_attrs)
 
 
+def test_xarray_coords_read_only(template, tmpdir):
+    files = paths_to("CMC_glb_TMP_ISBL_*_2020012512_*.grib2")
+    ds = open_dataset(files, template, invdir=tmpdir)
+
+    # Grid coordinates are shared with other datasets on the same grid
+    with pytest.raises(ValueError, match="read-only"):
+        ds["longitude"].values[0, 0] -= 360
+
+
 def test_xarray_open_dataset_empty(template, tmpdir):
     file = path_to("CMC_glb_APCP_SFC_0_ps30km_2020012500_P003.grib2")
 